@@ -0,0 +1,54 @@
+"""Fan out independent LLM calls concurrently with asyncio.gather.
+
+Running independent prompts sequentially costs the sum of their round-trip
+times; fanning them out with the async client costs roughly the slowest
+single call. Requires OPENAI_API_KEY in the environment (see .env.example).
+
+Usage:
+    python examples/async_fanout_completions.py
+"""
+
+import asyncio
+import time
+
+from test_ai.api_clients.openai_client import get_openai_client
+
+SAMPLE_CODE = """\
+def add(a, b):
+    return a + b
+"""
+
+LONG_TEXT = (
+    "Gorgon coordinates specialized AI agents across enterprise workflows, "
+    "with integrations for GitHub, Notion, and Gmail. Each agent owns one "
+    "responsibility: planning, building, testing, reviewing, or reporting."
+)
+
+
+async def main() -> None:
+    client = get_openai_client()
+
+    start = time.perf_counter()
+    review, summary, sop, haiku = await asyncio.gather(
+        client.generate_completion_async(
+            prompt=f"Review the following code:\n\n```\n{SAMPLE_CODE}\n```",
+            system_prompt="You are a concise code reviewer.",
+        ),
+        client.summarize_text_async(LONG_TEXT, max_length=50),
+        client.generate_sop_async("Deploying a FastAPI service to production"),
+        client.generate_completion_async(
+            prompt="Write a haiku about orchestration.",
+            temperature=0.5,
+        ),
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"Four completions in {elapsed:.1f}s (≈ the slowest single call)\n")
+    print("## Review\n", review, "\n")
+    print("## Summary\n", summary, "\n")
+    print("## SOP\n", sop, "\n")
+    print("## Haiku\n", haiku)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -30,7 +30,7 @@ from test_ai.workflow.loader import (
     list_workflows as list_yaml_workflows,
 )
 from test_ai.workflow.executor import WorkflowExecutor
-from test_ai.api_clients import OpenAIClient
+from test_ai.api_clients.openai_client import get_openai_client
 from test_ai.scheduler import (
     ScheduleManager,
     WorkflowSchedule,
@@ -376,7 +376,7 @@ app.add_exception_handler(APIException, api_exception_handler)
 # Initialize components
 workflow_engine = WorkflowEngineAdapter()
 prompt_manager = PromptTemplateManager()
-openai_client = OpenAIClient()
+openai_client = get_openai_client()
 
 # API v1 router
 v1_router = APIRouter(prefix="/v1", tags=["v1"])
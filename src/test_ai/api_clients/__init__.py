@@ -1,10 +1,28 @@
-"""API client integrations."""
+"""API client integrations.
 
-from .openai_client import OpenAIClient
-from .github_client import GitHubClient
-from .notion_client import NotionClientWrapper
-from .gmail_client import GmailClient
-from .claude_code_client import ClaudeCodeClient
+Clients are imported lazily (PEP 562) so that importing this package does
+not pull in every provider SDK; short-lived CLI invocations only pay the
+import cost of the client they actually use.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .openai_client import OpenAIClient
+    from .github_client import GitHubClient
+    from .notion_client import NotionClientWrapper
+    from .gmail_client import GmailClient
+    from .claude_code_client import ClaudeCodeClient
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "OpenAIClient": "openai_client",
+    "GitHubClient": "github_client",
+    "NotionClientWrapper": "notion_client",
+    "GmailClient": "gmail_client",
+    "ClaudeCodeClient": "claude_code_client",
+}
 
 __all__ = [
     "OpenAIClient",
@@ -13,3 +31,18 @@ __all__ = [
     "GmailClient",
     "ClaudeCodeClient",
 ]
+
+
+def __getattr__(name: str):
+    """Load client classes on first attribute access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Cache so subsequent accesses skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,63 @@
+"""Shared HTTP connection pools for API clients.
+
+The SDK defaults create one transport per client instance, so short-lived
+clients pay a fresh TCP+TLS handshake (~50-200ms) per cold connection.
+These module-level singletons give every wrapper a keep-alive pool that is
+reused across instances and closed once at interpreter exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Pool sizing for all outbound API traffic from this process
+_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30,
+)
+
+_sync_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.Client:
+    """Get the shared sync httpx client, creating it on first use."""
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = httpx.Client(limits=_LIMITS)
+    return _sync_client
+
+
+def get_shared_async_http_client() -> httpx.AsyncClient:
+    """Get the shared async httpx client, creating it on first use."""
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(limits=_LIMITS)
+    return _async_client
+
+
+def reset_shared_http_clients() -> None:
+    """Drop the shared clients so the next access creates fresh pools.
+
+    Useful for testing; does not close the old pools.
+    """
+    global _sync_client, _async_client
+    _sync_client = None
+    _async_client = None
+
+
+@atexit.register
+def _close_pools() -> None:
+    """Close pooled connections at interpreter exit."""
+    if _sync_client is not None:
+        try:
+            _sync_client.close()
+        except Exception:  # pragma: no cover - best-effort cleanup
+            logger.debug("Failed to close shared sync HTTP pool", exc_info=True)
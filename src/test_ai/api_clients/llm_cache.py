@@ -0,0 +1,130 @@
+"""Response cache for LLM completion calls.
+
+Deterministic completions (temperature == 0) are cached on a SHA-256 key of
+the full request shape (provider, model, messages, temperature, max_tokens)
+so repeated calls during dev/test iteration skip the network round-trip and
+token spend entirely. Non-deterministic requests (temperature > 0) are never
+cached.
+
+Backed by the shared cache backends in ``test_ai.cache`` (memory, Redis, or
+file), and gated via ``settings.llm_cache_enabled``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from test_ai.cache import Cache, get_cache
+from test_ai.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Default TTL for cached completions (1 hour)
+DEFAULT_TTL_SECONDS = 3600
+
+
+class LLMCache:
+    """Exact-match response cache for LLM completions.
+
+    Args:
+        backend: Cache backend to store responses in. Defaults to the
+            shared global cache from :func:`test_ai.cache.get_cache`.
+        ttl: Time-to-live for cached responses in seconds.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[Cache] = None,
+        ttl: int = DEFAULT_TTL_SECONDS,
+    ):
+        self._backend = backend if backend is not None else get_cache()
+        self._ttl = ttl
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def cache_key(
+        provider: str,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int] = None,
+    ) -> Optional[str]:
+        """Build a deterministic cache key, or None if the call is uncacheable.
+
+        Calls with temperature > 0 are non-deterministic and return None so
+        callers skip the cache entirely.
+        """
+        if temperature > 0:
+            return None
+
+        payload = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.sha256(payload.encode()).hexdigest()
+        return f"llm:{provider}:{digest}"
+
+    def get(self, key: Optional[str]) -> Optional[Any]:
+        """Look up a cached response. None key (uncacheable) always misses."""
+        if key is None:
+            return None
+
+        value = self._backend.get_sync(key)
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            logger.debug("LLM cache hit for %s", key)
+        return value
+
+    def set(self, key: Optional[str], value: Any) -> None:
+        """Store a response under key. No-op for None keys."""
+        if key is None:
+            return
+        self._backend.set_sync(key, value, ttl=self._ttl)
+
+    async def clear(self) -> None:
+        """Clear all cached responses and reset statistics."""
+        await self._backend.clear()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for observability."""
+        return {"hits": self._hits, "misses": self._misses}
+
+
+# Global cache instance
+_llm_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Get the global LLM cache, or None when disabled in settings."""
+    global _llm_cache
+
+    if not get_settings().llm_cache_enabled:
+        return None
+
+    if _llm_cache is None:
+        settings = get_settings()
+        _llm_cache = LLMCache(ttl=settings.llm_cache_ttl_seconds)
+
+    return _llm_cache
+
+
+def reset_llm_cache() -> None:
+    """Reset the global LLM cache instance. Useful for testing."""
+    global _llm_cache
+    _llm_cache = None
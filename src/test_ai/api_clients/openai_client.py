@@ -1,11 +1,175 @@
 """OpenAI API client wrapper with sync and async support."""
 
-from typing import Optional, List, Dict
+import asyncio
+import json
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+
 from openai import OpenAI, AsyncOpenAI
 
 from test_ai.config import get_settings
-from test_ai.utils.retry import with_retry, async_with_retry
-from test_ai.api_clients.resilience import resilient_call, resilient_call_async
+from test_ai.errors import BudgetExceededError
+from test_ai.api_clients.http_pool import (
+    get_shared_http_client,
+    get_shared_async_http_client,
+)
+from test_ai.api_clients.llm_cache import LLMCache, get_llm_cache
+from test_ai.api_clients.resilience import (
+    get_provider_bulkhead,
+    resilient_with_retry,
+    resilient_with_retry_async,
+)
+from test_ai.ratelimit.provider import get_provider_limiter
+
+
+def _estimate_tokens(text: str) -> int:
+    """Estimate the token count of a prompt without calling the API.
+
+    Uses tiktoken when available; otherwise falls back to the ~4 chars per
+    token heuristic used elsewhere in this codebase.
+    """
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return max(1, len(text) // 4)
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Lazy-load the tiktoken encoding, or None if tiktoken is absent."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except ImportError:
+        return None
+
+
+def _truncate_middle(text: str, max_tokens: Optional[int]) -> str:
+    """Trim the middle of oversized input, keeping the head and tail.
+
+    Billing is linear in input tokens, so inputs beyond max_tokens are
+    elided in the middle with an explicit marker rather than sent whole.
+    Uses tiktoken when available; otherwise the ~4 chars per token
+    heuristic. Returns text unchanged when max_tokens is None or the
+    input fits.
+    """
+    if max_tokens is None or max_tokens <= 0:
+        return text
+
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        half = max_tokens // 2
+        elided = len(tokens) - 2 * half
+        return (
+            encoding.decode(tokens[:half])
+            + f"\n...[{elided} tokens elided]...\n"
+            + encoding.decode(tokens[-half:])
+        )
+
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    half = max_chars // 2
+    elided = (len(text) - 2 * half) // 4
+    return (
+        text[:half] + f"\n...[~{elided} tokens elided]...\n" + text[-half:]
+    )
+
+
+def _budget_preflight(messages: List[Dict[str, str]]) -> int:
+    """Short-circuit over-budget calls before paying the network round-trip.
+
+    Estimates the prompt's token count locally and checks it against the
+    global budget tracker. No-op unless settings.llm_budget_preflight_enabled.
+
+    Returns:
+        The estimated input token count (0 when pre-flight is disabled)
+
+    Raises:
+        BudgetExceededError: If the estimated tokens cannot be allocated
+    """
+    if not get_settings().llm_budget_preflight_enabled:
+        return 0
+
+    from test_ai.budget import get_budget_tracker
+
+    estimated = sum(_estimate_tokens(m["content"]) for m in messages)
+    tracker = get_budget_tracker()
+    if not tracker.can_allocate(estimated):
+        raise BudgetExceededError(
+            f"Estimated {estimated} input tokens exceed remaining budget "
+            f"({tracker.remaining} of {tracker.total_budget})",
+            budget=tracker.total_budget,
+            used=tracker.used,
+        )
+    return estimated
+
+
+def _record_completion_usage(estimated_input: int, result: str) -> None:
+    """Record actual-ish usage with the budget tracker after a call."""
+    if estimated_input <= 0:
+        return
+
+    from test_ai.budget import get_budget_tracker
+
+    get_budget_tracker().record_usage(
+        agent_id="openai",
+        tokens=estimated_input + _estimate_tokens(result),
+    )
+
+
+# Static system prompts shared by the sync and async helper methods,
+# built once at import instead of per call.
+_SUMMARIZE_SYSTEM_PROMPT = (
+    "You are a helpful assistant that creates clear, concise summaries."
+)
+_SOP_SYSTEM_PROMPT = (
+    "You are an expert at creating clear, detailed Standard Operating Procedures."
+)
+
+_BATCH_SYSTEM_PROMPT = (
+    "You will receive multiple independent prompts, each introduced by a "
+    "'### PROMPT <n>' header. Answer every prompt separately and respond "
+    "with ONLY a JSON array of strings, one answer per prompt, in order. "
+    "Do not wrap the array in markdown fences or add any other text."
+)
+
+
+def _marshal_batch_prompt(prompts: List[str]) -> str:
+    """Concatenate independent prompts into one delimited batch prompt."""
+    sections = [
+        f"### PROMPT {i + 1}\n{prompt}" for i, prompt in enumerate(prompts)
+    ]
+    header = f"Answer each of the following {len(prompts)} prompts.\n\n"
+    return header + "\n\n".join(sections)
+
+
+def _parse_batch_response(response: str, expected: int) -> List[str]:
+    """Parse a marshaled batch response back into one answer per prompt.
+
+    Raises:
+        json.JSONDecodeError: If the response is not valid JSON
+        ValueError: If the parsed value is not a list of the expected length
+    """
+    text = response.strip()
+    # Tolerate models that wrap the array in markdown fences despite
+    # instructions
+    if text.startswith("```"):
+        text = text.strip("`")
+        if text.startswith("json"):
+            text = text[4:]
+        text = text.strip()
+
+    answers = json.loads(text)
+    if not isinstance(answers, list) or len(answers) != expected:
+        raise ValueError(
+            f"Expected a JSON array of {expected} answers, got: {type(answers).__name__}"
+        )
+    return [str(answer) for answer in answers]
 
 
 class OpenAIClient:
@@ -17,7 +181,10 @@ class OpenAIClient:
 
     def __init__(self):
         settings = get_settings()
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        self.client = OpenAI(
+            api_key=settings.openai_api_key,
+            http_client=get_shared_http_client(),
+        )
         self._async_client: Optional[AsyncOpenAI] = None
 
     @property
@@ -25,7 +192,10 @@ class OpenAIClient:
         """Lazy-load async client on first access."""
         if self._async_client is None:
             settings = get_settings()
-            self._async_client = AsyncOpenAI(api_key=settings.openai_api_key)
+            self._async_client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                http_client=get_shared_async_http_client(),
+            )
         return self._async_client
 
     def generate_completion(
@@ -46,8 +216,7 @@ class OpenAIClient:
 
         return self._call_api(model, messages, temperature, max_tokens)
 
-    @resilient_call("openai")
-    @with_retry(max_retries=3, base_delay=1.0, max_delay=30.0)
+    @resilient_with_retry("openai", max_retries=3, base_delay=1.0, max_delay=30.0)
     def _call_api(
         self,
         model: str,
@@ -56,20 +225,227 @@ class OpenAIClient:
         max_tokens: Optional[int],
     ) -> str:
         """Make the actual API call with retry logic and resilience."""
+        cache = get_llm_cache()
+        key = None
+        if cache is not None:
+            key = LLMCache.cache_key("openai", model, messages, temperature, max_tokens)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        estimated_input = _budget_preflight(messages)
+
         response = self.client.chat.completions.create(
             model=model,
             messages=messages,
             temperature=temperature,
             max_tokens=max_tokens,
         )
-        return response.choices[0].message.content
+        result = response.choices[0].message.content
+        _record_completion_usage(estimated_input, result)
+
+        if cache is not None:
+            cache.set(key, result)
+
+        return result
+
+    def generate_completion_stream(
+        self,
+        prompt: str,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Generate a completion, yielding text chunks as they arrive.
+
+        Unlike generate_completion, callers see the first tokens at
+        time-to-first-token instead of waiting for the full response body.
+        Streamed responses are not cached or retried, but they go through
+        the same rate limiter and bulkhead accounting as _call_api.
+        """
+        messages: List[Dict[str, str]] = []
+
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+
+        messages.append({"role": "user", "content": prompt})
+
+        if not get_provider_limiter("openai").acquire(wait=True):
+            raise RuntimeError("Rate limit exceeded for openai")
+
+        bulkhead = get_provider_bulkhead("openai")
+        if not bulkhead.acquire():
+            raise RuntimeError("Bulkhead full for openai")
+
+        try:
+            stream = self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+            )
+            for event in stream:
+                if event.choices:
+                    yield event.choices[0].delta.content or ""
+        finally:
+            bulkhead.release()
+
+    def generate_completion_batch(
+        self,
+        prompts: List[str],
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        batch_size: int = 5,
+    ) -> List[str]:
+        """Generate completions for multiple independent prompts.
+
+        Marshals up to batch_size prompts into a single API call (one
+        round-trip instead of N) and parses the structured response. Falls
+        back to one call per prompt for any batch whose response cannot be
+        parsed, so callers always get exactly one result per prompt.
+        """
+        if not prompts:
+            return []
+
+        results: List[str] = []
+        for start in range(0, len(prompts), batch_size):
+            batch = prompts[start : start + batch_size]
+            if len(batch) == 1:
+                results.append(
+                    self.generate_completion(
+                        batch[0], model, temperature, max_tokens, system_prompt
+                    )
+                )
+                continue
+
+            try:
+                results.extend(
+                    self._call_batch(batch, model, temperature, max_tokens, system_prompt)
+                )
+            except (json.JSONDecodeError, ValueError):
+                # Response was not the expected JSON array; retry one-by-one
+                results.extend(
+                    self.generate_completion(
+                        prompt, model, temperature, max_tokens, system_prompt
+                    )
+                    for prompt in batch
+                )
+
+        return results
+
+    def _call_batch(
+        self,
+        batch: List[str],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        system_prompt: Optional[str],
+    ) -> List[str]:
+        """Send one marshaled call for a batch and parse the JSON array back."""
+        marshaled = _marshal_batch_prompt(batch)
+        batch_system = _BATCH_SYSTEM_PROMPT
+        if system_prompt:
+            batch_system = f"{system_prompt}\n\n{_BATCH_SYSTEM_PROMPT}"
+
+        response = self.generate_completion(
+            marshaled, model, temperature, max_tokens, batch_system
+        )
+        return _parse_batch_response(response, expected=len(batch))
+
+    def submit_batch(
+        self,
+        prompts: List[str],
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        """Submit prompts to the OpenAI Batch API for offline processing.
+
+        Batch API calls are roughly half the price of direct calls and do
+        not count against RPM limits, at the cost of up-to-24h turnaround.
+        Suitable for bulk summarization/SOP workloads where multi-minute
+        (or longer) latency is acceptable.
+
+        Returns:
+            The batch job id, to be polled with fetch_batch.
+        """
+        lines = []
+        for i, prompt in enumerate(prompts):
+            messages: List[Dict[str, str]] = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": prompt})
+
+            body: Dict[str, object] = {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+            }
+            if max_tokens is not None:
+                body["max_tokens"] = max_tokens
+
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": f"prompt-{i}",
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": body,
+                    }
+                )
+            )
+
+        input_file = self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    def fetch_batch(self, batch_id: str) -> Optional[List[str]]:
+        """Fetch results of a batch job submitted with submit_batch.
+
+        Returns:
+            The completions in submission order once the job has completed,
+            or None while it is still in progress.
+
+        Raises:
+            RuntimeError: If the batch job failed, expired, or was cancelled
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"Batch {batch_id} {batch.status}")
+        if batch.status != "completed":
+            return None
+
+        content = self.client.files.content(batch.output_file_id).text
+        results: Dict[int, str] = {}
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            obj = json.loads(line)
+            index = int(obj["custom_id"].rsplit("-", 1)[1])
+            results[index] = obj["response"]["body"]["choices"][0]["message"][
+                "content"
+            ]
+        return [results[i] for i in sorted(results)]
 
     def summarize_text(self, text: str, max_length: int = 500) -> str:
         """Summarize text using GPT."""
+        text = _truncate_middle(text, get_settings().llm_max_input_tokens)
         prompt = f"Please provide a concise summary (max {max_length} words) of the following text:\n\n{text}"
         return self.generate_completion(
             prompt=prompt,
-            system_prompt="You are a helpful assistant that creates clear, concise summaries.",
+            system_prompt=_SUMMARIZE_SYSTEM_PROMPT,
         )
 
     def generate_sop(self, task_description: str) -> str:
@@ -77,7 +453,7 @@ class OpenAIClient:
         prompt = f"Create a detailed Standard Operating Procedure (SOP) for: {task_description}"
         return self.generate_completion(
             prompt=prompt,
-            system_prompt="You are an expert at creating clear, detailed Standard Operating Procedures.",
+            system_prompt=_SOP_SYSTEM_PROMPT,
         )
 
     # -------------------------------------------------------------------------
@@ -102,8 +478,7 @@ class OpenAIClient:
 
         return await self._call_api_async(model, messages, temperature, max_tokens)
 
-    @resilient_call_async("openai")
-    @async_with_retry(max_retries=3, base_delay=1.0, max_delay=30.0)
+    @resilient_with_retry_async("openai", max_retries=3, base_delay=1.0, max_delay=30.0)
     async def _call_api_async(
         self,
         model: str,
@@ -112,20 +487,101 @@ class OpenAIClient:
         max_tokens: Optional[int],
     ) -> str:
         """Make the actual API call with retry logic and resilience (async)."""
+        cache = get_llm_cache()
+        key = None
+        if cache is not None:
+            key = LLMCache.cache_key("openai", model, messages, temperature, max_tokens)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        estimated_input = _budget_preflight(messages)
+
         response = await self.async_client.chat.completions.create(
             model=model,
             messages=messages,
             temperature=temperature,
             max_tokens=max_tokens,
         )
-        return response.choices[0].message.content
+        result = response.choices[0].message.content
+        _record_completion_usage(estimated_input, result)
+
+        if cache is not None:
+            cache.set(key, result)
+
+        return result
+
+    async def generate_completion_stream_async(
+        self,
+        prompt: str,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Generate a completion, yielding text chunks as they arrive (async)."""
+        messages: List[Dict[str, str]] = []
+
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+
+        messages.append({"role": "user", "content": prompt})
+
+        if not await get_provider_limiter("openai").acquire_async(wait=True):
+            raise RuntimeError("Rate limit exceeded for openai")
+
+        bulkhead = get_provider_bulkhead("openai")
+        if not await bulkhead.acquire_async():
+            raise RuntimeError("Bulkhead full for openai")
+
+        try:
+            stream = await self.async_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+            )
+            async for event in stream:
+                if event.choices:
+                    yield event.choices[0].delta.content or ""
+        finally:
+            await bulkhead.release_async()
+
+    async def generate_completion_batch_async(
+        self,
+        prompts: List[str],
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        max_concurrency: int = 5,
+    ) -> List[str]:
+        """Generate completions for multiple prompts concurrently (async).
+
+        Fans out generate_completion_async across the prompts with a
+        semaphore bounding in-flight requests, preserving input order.
+        """
+        if not prompts:
+            return []
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate_completion_async(
+                    prompt, model, temperature, max_tokens, system_prompt
+                )
+
+        return list(await asyncio.gather(*(_one(prompt) for prompt in prompts)))
 
     async def summarize_text_async(self, text: str, max_length: int = 500) -> str:
         """Summarize text using GPT (async)."""
+        text = _truncate_middle(text, get_settings().llm_max_input_tokens)
         prompt = f"Please provide a concise summary (max {max_length} words) of the following text:\n\n{text}"
         return await self.generate_completion_async(
             prompt=prompt,
-            system_prompt="You are a helpful assistant that creates clear, concise summaries.",
+            system_prompt=_SUMMARIZE_SYSTEM_PROMPT,
         )
 
     async def generate_sop_async(self, task_description: str) -> str:
@@ -133,5 +589,28 @@ class OpenAIClient:
         prompt = f"Create a detailed Standard Operating Procedure (SOP) for: {task_description}"
         return await self.generate_completion_async(
             prompt=prompt,
-            system_prompt="You are an expert at creating clear, detailed Standard Operating Procedures.",
+            system_prompt=_SOP_SYSTEM_PROMPT,
         )
+
+
+# Shared per-process client instance
+_shared_client: Optional[OpenAIClient] = None
+
+
+def get_openai_client() -> OpenAIClient:
+    """Get the shared OpenAIClient instance.
+
+    Matches the get_budget_tracker() singleton pattern; callers in servers
+    and agent loops reuse one client (and its connection state) instead of
+    constructing a new instance per call site.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = OpenAIClient()
+    return _shared_client
+
+
+def reset_openai_client() -> None:
+    """Reset the shared client instance. Useful for testing."""
+    global _shared_client
+    _shared_client = None
@@ -172,6 +172,154 @@ def resilient_call_async(
     return decorator
 
 
+def resilient_with_retry(
+    provider: str,
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    rate_limit: bool = True,
+    bulkhead: bool = True,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Fused resilience + retry decorator for sync API calls.
+
+    Performs the rate-limit/bulkhead checks and the retry loop in a single
+    wrapper frame instead of stacking @resilient_call on @with_retry,
+    halving the per-call wrapper overhead on hot call paths. Semantics
+    match the stacked form: limits are acquired once, retries run inside
+    the bulkhead slot.
+    """
+    import time
+
+    from test_ai.utils.retry import RetryConfig, is_retryable_error
+    from test_ai.errors import MaxRetriesError
+
+    config = RetryConfig(
+        max_retries=max_retries, base_delay=base_delay, max_delay=max_delay
+    )
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            if rate_limit:
+                limiter = get_provider_limiter(provider)
+                if not limiter.acquire(wait=True):
+                    raise RuntimeError(f"Rate limit exceeded for {provider}")
+
+            bh = get_provider_bulkhead(provider) if bulkhead else None
+            if bh is not None and not bh.acquire():
+                raise RuntimeError(f"Bulkhead full for {provider}")
+
+            try:
+                for attempt in range(config.max_retries + 1):
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception as exc:
+                        if not is_retryable_error(exc):
+                            raise
+                        if attempt >= config.max_retries:
+                            logger.warning(
+                                "Max retries (%d) exhausted for %s: %s",
+                                config.max_retries,
+                                func.__name__,
+                                exc,
+                            )
+                            raise MaxRetriesError(
+                                f"Max retries exceeded for {func.__name__}: {exc}",
+                                stage=func.__name__,
+                                attempts=attempt + 1,
+                            ) from exc
+
+                        delay = config.calculate_delay(attempt)
+                        logger.info(
+                            "Retry %d/%d for %s after %.2fs: %s",
+                            attempt + 1,
+                            config.max_retries,
+                            func.__name__,
+                            delay,
+                            exc,
+                        )
+                        time.sleep(delay)
+            finally:
+                if bh is not None:
+                    bh.release()
+
+        return wrapper
+
+    return decorator
+
+
+def resilient_with_retry_async(
+    provider: str,
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    rate_limit: bool = True,
+    bulkhead: bool = True,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Fused resilience + retry decorator for async API calls.
+
+    Async counterpart of resilient_with_retry.
+    """
+    import asyncio
+
+    from test_ai.utils.retry import RetryConfig, is_retryable_error
+    from test_ai.errors import MaxRetriesError
+
+    config = RetryConfig(
+        max_retries=max_retries, base_delay=base_delay, max_delay=max_delay
+    )
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            if rate_limit:
+                limiter = get_provider_limiter(provider)
+                if not await limiter.acquire_async(wait=True):
+                    raise RuntimeError(f"Rate limit exceeded for {provider}")
+
+            bh = get_provider_bulkhead(provider) if bulkhead else None
+            if bh is not None and not await bh.acquire_async():
+                raise RuntimeError(f"Bulkhead full for {provider}")
+
+            try:
+                for attempt in range(config.max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as exc:
+                        if not is_retryable_error(exc):
+                            raise
+                        if attempt >= config.max_retries:
+                            logger.warning(
+                                "Max retries (%d) exhausted for %s: %s",
+                                config.max_retries,
+                                func.__name__,
+                                exc,
+                            )
+                            raise MaxRetriesError(
+                                f"Max retries exceeded for {func.__name__}: {exc}",
+                                stage=func.__name__,
+                                attempts=attempt + 1,
+                            ) from exc
+
+                        delay = config.calculate_delay(attempt)
+                        logger.info(
+                            "Retry %d/%d for %s after %.2fs: %s",
+                            attempt + 1,
+                            config.max_retries,
+                            func.__name__,
+                            delay,
+                            exc,
+                        )
+                        await asyncio.sleep(delay)
+            finally:
+                if bh is not None:
+                    await bh.release_async()
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
 class ResilientClientMixin:
     """Mixin that provides resilience methods for API clients.
 
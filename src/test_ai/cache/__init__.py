@@ -19,11 +19,14 @@ Usage:
         ...
 """
 
-from test_ai.cache.backends import Cache, get_cache
+from test_ai.cache.backends import Cache, FileCache, MemoryCache, RedisCache, get_cache
 from test_ai.cache.decorators import cached, async_cached
 
 __all__ = [
     "Cache",
+    "MemoryCache",
+    "RedisCache",
+    "FileCache",
     "get_cache",
     "cached",
     "async_cached",
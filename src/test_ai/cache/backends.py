@@ -69,6 +69,20 @@ class Cache(ABC):
         """Synchronous get for non-async contexts."""
         pass
 
+    async def get_many(self, keys: list[str]) -> Dict[str, Any]:
+        """Get multiple keys at once, omitting misses.
+
+        Default implementation loops over get(); backends with a cheaper
+        bulk path (one lock acquisition, one network round-trip) override
+        this so multi-key loads don't pay per-key overhead.
+        """
+        results: Dict[str, Any] = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                results[key] = value
+        return results
+
     @abstractmethod
     def set_sync(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Synchronous set for non-async contexts."""
@@ -141,6 +155,24 @@ class MemoryCache(Cache):
 
             self._cache[key] = CacheEntry(value=value, expires_at=expires_at)
 
+    async def get_many(self, keys: list[str]) -> Dict[str, Any]:
+        """Get multiple keys under a single lock acquisition."""
+        now = time.time()
+        results: Dict[str, Any] = {}
+        with self._lock:
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry is None:
+                    self._stats.misses += 1
+                    continue
+                if entry.expires_at is not None and now > entry.expires_at:
+                    del self._cache[key]
+                    self._stats.misses += 1
+                    continue
+                self._stats.hits += 1
+                results[key] = entry.value
+        return results
+
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
         with self._lock:
@@ -301,6 +333,24 @@ class RedisCache(Cache):
         else:
             client.set(self._make_key(key), data)
 
+    async def get_many(self, keys: list[str]) -> Dict[str, Any]:
+        """Get multiple keys with one MGET round-trip."""
+        if not keys:
+            return {}
+
+        client = await self._get_async_client()
+        values = await client.mget([self._make_key(key) for key in keys])
+
+        results: Dict[str, Any] = {}
+        for key, data in zip(keys, values):
+            if data is None:
+                continue
+            try:
+                results[key] = json.loads(data)
+            except json.JSONDecodeError:
+                results[key] = data.decode() if isinstance(data, bytes) else data
+        return results
+
     async def delete(self, key: str) -> bool:
         """Delete key from Redis."""
         client = await self._get_async_client()
@@ -325,6 +375,87 @@ class RedisCache(Cache):
                 break
 
 
+class FileCache(Cache):
+    """File-backed cache for persistence across process restarts.
+
+    Stores each entry as a JSON file under a cache directory. Suitable for
+    caching expensive results (e.g. LLM responses) between dev/test runs
+    without requiring Redis.
+
+    Args:
+        cache_dir: Directory to store cache files in
+        default_ttl: Default TTL in seconds (default: None = no expiration)
+    """
+
+    def __init__(self, cache_dir: str, default_ttl: Optional[int] = None):
+        from pathlib import Path
+
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._default_ttl = default_ttl
+        self._lock = Lock()
+
+    def _path_for(self, key: str):
+        """Map a cache key to a file path (hashed to stay filesystem-safe)."""
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self._cache_dir / f"{digest}.json"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from file cache."""
+        return self.get_sync(key)
+
+    def get_sync(self, key: str) -> Optional[Any]:
+        """Synchronous get."""
+        path = self._path_for(key)
+        with self._lock:
+            if not path.exists():
+                return None
+            try:
+                entry = json.loads(path.read_text())
+            except (json.JSONDecodeError, OSError):
+                return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and time.time() > expires_at:
+            with self._lock:
+                path.unlink(missing_ok=True)
+            return None
+
+        return entry.get("value")
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in file cache."""
+        self.set_sync(key, value, ttl)
+
+    def set_sync(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Synchronous set."""
+        ttl = ttl if ttl is not None else self._default_ttl
+        expires_at = time.time() + ttl if ttl else None
+
+        entry = json.dumps({"value": value, "expires_at": expires_at}, default=str)
+        with self._lock:
+            self._path_for(key).write_text(entry)
+
+    async def delete(self, key: str) -> bool:
+        """Delete key from file cache."""
+        path = self._path_for(key)
+        with self._lock:
+            if path.exists():
+                path.unlink(missing_ok=True)
+                return True
+            return False
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists and is not expired."""
+        return self.get_sync(key) is not None
+
+    async def clear(self) -> None:
+        """Clear all cached files."""
+        with self._lock:
+            for path in self._cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+
 @dataclass
 class CacheStats:
     """Cache statistics."""
@@ -130,6 +130,28 @@ class Settings(BaseSettings):
         description="Comma-separated list of allowed shell commands (empty = all allowed)",
     )
 
+    # LLM Response Cache
+    llm_cache_enabled: bool = Field(
+        False,
+        description="Cache deterministic (temperature=0) LLM completions",
+    )
+    llm_cache_ttl_seconds: int = Field(
+        3600, description="TTL for cached LLM completions in seconds"
+    )
+    llm_budget_preflight_enabled: bool = Field(
+        False,
+        description="Check estimated prompt tokens against the budget tracker before LLM calls",
+    )
+    llm_max_input_tokens: Optional[int] = Field(
+        None,
+        description="Middle-truncate oversized LLM inputs to this many tokens (None = no limit)",
+    )
+
+    # Scheduler
+    max_concurrent_schedules: int = Field(
+        5, description="Maximum scheduled workflows executing concurrently"
+    )
+
     # Rate Limiting (API clients)
     ratelimit_openai_rpm: int = Field(60, description="OpenAI requests per minute")
     ratelimit_openai_tpm: int = Field(90000, description="OpenAI tokens per minute")
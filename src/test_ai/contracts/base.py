@@ -6,7 +6,20 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
-from jsonschema import validate, ValidationError as JsonSchemaError
+from jsonschema import ValidationError as JsonSchemaError
+from jsonschema.validators import validator_for
+
+
+def _compile_validator(schema: dict[str, Any]):
+    """Compile a JSON schema into a reusable validator instance.
+
+    jsonschema.validate() re-resolves the validator class and re-checks the
+    schema on every call; compiling once at contract construction keeps the
+    per-handoff cost to the validation walk itself.
+    """
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
 
 
 class AgentRole(Enum):
@@ -63,6 +76,10 @@ class AgentContract:
     description: str = ""
     required_context: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        self._input_validator = _compile_validator(self.input_schema)
+        self._output_validator = _compile_validator(self.output_schema)
+
     def validate_input(self, data: dict) -> bool:
         """Validate input data against the contract's input schema.
 
@@ -76,7 +93,7 @@ class AgentContract:
             ContractViolation: If validation fails
         """
         try:
-            validate(instance=data, schema=self.input_schema)
+            self._input_validator.validate(data)
             return True
         except JsonSchemaError as e:
             raise ContractViolation(
@@ -103,7 +120,7 @@ class AgentContract:
             ContractViolation: If validation fails
         """
         try:
-            validate(instance=data, schema=self.output_schema)
+            self._output_validator.validate(data)
             return True
         except JsonSchemaError as e:
             raise ContractViolation(
@@ -843,6 +843,15 @@ _CONTRACT_REGISTRY: dict[AgentRole, AgentContract] = {
 }
 
 
+# Lookup map accepting either AgentRole or its string value, so get_contract
+# resolves any caller-supplied key with a single dict.get instead of an
+# isinstance check plus try/except enum conversion per handoff.
+_CONTRACT_BY_ANY: dict[AgentRole | str, AgentContract] = {
+    **_CONTRACT_REGISTRY,
+    **{role.value: contract for role, contract in _CONTRACT_REGISTRY.items()},
+}
+
+
 def get_contract(role: AgentRole | str) -> AgentContract:
     """Get the contract for a given role.
 
@@ -855,16 +864,17 @@ def get_contract(role: AgentRole | str) -> AgentContract:
     Raises:
         ValueError: If role is not found
     """
-    if isinstance(role, str):
-        try:
-            role = AgentRole(role)
-        except ValueError:
+    contract = _CONTRACT_BY_ANY.get(role)
+    if contract is None:
+        if isinstance(role, str):
             raise ValueError(f"Unknown role: {role}")
-
-    if role not in _CONTRACT_REGISTRY:
         raise ValueError(f"No contract defined for role: {role.value}")
+    return contract
+
 
-    return _CONTRACT_REGISTRY[role]
+# Cached list_contracts() result; the registry is write-rare, so the
+# summaries are built once and invalidated by register_contract.
+_LIST_CACHE: tuple[dict, ...] | None = None
 
 
 def register_contract(contract: AgentContract) -> None:
@@ -873,7 +883,11 @@ def register_contract(contract: AgentContract) -> None:
     Args:
         contract: The AgentContract to register
     """
+    global _LIST_CACHE
     _CONTRACT_REGISTRY[contract.role] = contract
+    _CONTRACT_BY_ANY[contract.role] = contract
+    _CONTRACT_BY_ANY[contract.role.value] = contract
+    _LIST_CACHE = None
 
 
 def list_contracts() -> list[dict]:
@@ -882,11 +896,14 @@ def list_contracts() -> list[dict]:
     Returns:
         List of contract summaries
     """
-    return [
-        {
-            "role": role.value,
-            "description": contract.description,
-            "required_context": contract.required_context,
-        }
-        for role, contract in _CONTRACT_REGISTRY.items()
-    ]
+    global _LIST_CACHE
+    if _LIST_CACHE is None:
+        _LIST_CACHE = tuple(
+            {
+                "role": role.value,
+                "description": contract.description,
+                "required_context": contract.required_context,
+            }
+            for role, contract in _CONTRACT_REGISTRY.items()
+        )
+    return list(_LIST_CACHE)
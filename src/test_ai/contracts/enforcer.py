@@ -15,9 +15,27 @@ from typing import Any, Callable, Awaitable
 from test_ai.contracts.base import AgentRole, ContractViolation
 from test_ai.contracts.definitions import get_contract
 
+# Enum member -> interned value string, mirroring validator.py
+_ROLE_STR = {role: role.value for role in AgentRole}
+
 logger = logging.getLogger(__name__)
 
 
+def _get_schema_str(role_str: str) -> str:
+    """Get the pretty-printed output schema for a role.
+
+    Cached on the contract instance so repeated violations for the same
+    role don't re-serialize an identical schema; replacing the contract
+    via register_contract naturally drops the cached string with it.
+    """
+    contract = get_contract(role_str)
+    cached = getattr(contract, "_schema_str", None)
+    if cached is None:
+        cached = json.dumps(contract.output_schema, indent=2)
+        contract._schema_str = cached
+    return cached
+
+
 @dataclass
 class EnforcementResult:
     """Result of a validate-and-retry enforcement cycle.
@@ -99,7 +117,7 @@ class ContractEnforcer:
         Raises:
             ContractViolation: If the output violates the contract.
         """
-        role_str = role.value if isinstance(role, AgentRole) else role
+        role_str = _ROLE_STR.get(role, role)
         counters = self._counters[role_str]
         counters.validations += 1
 
@@ -227,8 +245,7 @@ class ContractEnforcer:
         """
         role_str = violation.role or "unknown"
         try:
-            contract = get_contract(role_str)
-            schema_str = json.dumps(contract.output_schema, indent=2)
+            schema_str = _get_schema_str(role_str)
         except ValueError:
             schema_str = "(schema unavailable)"
 
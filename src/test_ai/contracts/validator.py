@@ -8,6 +8,10 @@ from datetime import datetime, timezone
 from .base import AgentRole, ContractViolation
 from .definitions import get_contract
 
+# Enum member -> interned value string; one dict lookup instead of an
+# isinstance branch plus attribute access per validation
+_ROLE_STR = {role: role.value for role in AgentRole}
+
 
 @dataclass
 class ValidationResult:
@@ -64,7 +68,7 @@ class ContractValidator:
             ContractViolation: If strict=True and validation fails
         """
         contract = get_contract(role)
-        role_name = role.value if isinstance(role, AgentRole) else role
+        role_name = _ROLE_STR.get(role, role)
 
         errors = []
         warnings = []
@@ -117,7 +121,7 @@ class ContractValidator:
             ContractViolation: If strict=True and validation fails
         """
         contract = get_contract(role)
-        role_name = role.value if isinstance(role, AgentRole) else role
+        role_name = _ROLE_STR.get(role, role)
 
         errors = []
         warnings = []
@@ -1,11 +1,13 @@
 """Streamlit dashboard for Gorgon AI Workflow Orchestrator."""
 
 import json
+from pathlib import Path
+
 import streamlit as st
 
 from test_ai.orchestrator import WorkflowEngineAdapter, Workflow, WorkflowStep, StepType
 from test_ai.prompts import PromptTemplateManager, PromptTemplate
-from test_ai.api_clients import OpenAIClient
+from test_ai.api_clients.openai_client import get_openai_client as _get_shared_openai_client
 
 # Import monitoring pages
 from test_ai.dashboard.monitoring_pages import (
@@ -36,6 +38,12 @@ except ImportError:
 
 
 # Initialize components
+# Enum options never change; build the selectbox choices once per import
+# instead of per rerun (and per step row)
+STEP_TYPE_OPTIONS = tuple(step_type.value for step_type in StepType)
+MODEL_OPTIONS = ("gpt-4o-mini", "gpt-4o", "gpt-3.5-turbo")
+
+
 @st.cache_resource
 def get_workflow_engine():
     """Get cached workflow engine."""
@@ -51,7 +59,7 @@ def get_prompt_manager():
 @st.cache_resource
 def get_openai_client():
     """Get cached OpenAI client."""
-    return OpenAIClient()
+    return _get_shared_openai_client()
 
 
 def render_sidebar():
@@ -187,7 +195,7 @@ def render_workflows_page():
                     "Step ID", key=f"step_id_{i}", value=f"step_{i + 1}"
                 )
                 step_type = st.selectbox(
-                    "Step Type", [st.value for st in StepType], key=f"step_type_{i}"
+                    "Step Type", STEP_TYPE_OPTIONS, key=f"step_type_{i}"
                 )
             with col2:
                 step_action = st.text_input("Action", key=f"step_action_{i}")
@@ -287,7 +295,7 @@ def render_prompts_page():
 
         col1, col2 = st.columns(2)
         with col1:
-            model = st.selectbox("Model", ["gpt-4o-mini", "gpt-4o", "gpt-3.5-turbo"])
+            model = st.selectbox("Model", MODEL_OPTIONS)
         with col2:
             temperature = st.slider("Temperature", 0.0, 2.0, 0.7)
 
@@ -372,6 +380,15 @@ def render_execute_page():
                         st.error(f"Error executing workflow: {str(e)}")
 
 
+@st.cache_data(ttl=60)
+def _list_log_files(logs_dir: str) -> list[str]:
+    """List recent workflow log paths, cached so the directory is not
+    re-globbed and re-sorted on every widget-interaction rerun."""
+    from pathlib import Path
+
+    return [str(p) for p in sorted(Path(logs_dir).glob("workflow_*.json"), reverse=True)]
+
+
 def render_logs_page():
     """Render logs page."""
     st.title("📋 Workflow Logs")
@@ -379,7 +396,7 @@ def render_logs_page():
     workflow_engine = get_workflow_engine()
     logs_dir = workflow_engine.settings.logs_dir
 
-    log_files = sorted(logs_dir.glob("workflow_*.json"), reverse=True)
+    log_files = [Path(p) for p in _list_log_files(str(logs_dir))]
 
     if log_files:
         for log_file in log_files[:20]:
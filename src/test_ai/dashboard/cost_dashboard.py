@@ -146,19 +146,14 @@ def _render_overview_tab(tracker: CostTracker) -> None:
 
 def _render_daily_trend(tracker: CostTracker) -> None:
     """Render daily cost trend."""
-    # Get costs for last 7 days
-    daily_costs = []
-    for i in range(7):
-        date = datetime.now() - timedelta(days=i)
-        cost = tracker.get_daily_cost(date)
-        daily_costs.append(
-            {
-                "date": date.strftime("%m/%d"),
-                "cost": cost,
-            }
-        )
-
-    daily_costs.reverse()
+    # Get costs for last 7 days in a single pass over the entries
+    daily_costs = [
+        {
+            "date": datetime.fromisoformat(day).strftime("%m/%d"),
+            "cost": cost,
+        }
+        for day, cost in tracker.get_daily_costs(days=7).items()
+    ]
 
     if any(d["cost"] > 0 for d in daily_costs):
         # Simple bar chart representation
@@ -169,7 +164,18 @@ def _render_daily_trend(tracker: CostTracker) -> None:
             with cols[i]:
                 height = int((day["cost"] / max_cost) * 100) if max_cost > 0 else 0
                 st.markdown(
-                    f"""
+                    _trend_bar_html(day["date"], day["cost"], height),
+                    unsafe_allow_html=True,
+                )
+    else:
+        st.info("No cost data available for the last 7 days")
+
+
+@st.cache_data
+def _trend_bar_html(date: str, cost: float, height: int) -> str:
+    """Build one trend bar's HTML, memoized so unchanged days skip the
+    string formatting on every widget-interaction rerun."""
+    return f"""
                     <div style="text-align: center;">
                         <div style="
                             width: 30px;
@@ -178,14 +184,10 @@ def _render_daily_trend(tracker: CostTracker) -> None:
                             margin: 0 auto {100 - height}px auto;
                             border-radius: 4px 4px 0 0;
                         "></div>
-                        <div style="font-size: 10px;">{day["date"]}</div>
-                        <div style="font-size: 10px;">${day["cost"]:.2f}</div>
+                        <div style="font-size: 10px;">{date}</div>
+                        <div style="font-size: 10px;">${cost:.2f}</div>
                     </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
-    else:
-        st.info("No cost data available for the last 7 days")
+                    """
 
 
 def _render_agent_tab(tracker: CostTracker) -> None:
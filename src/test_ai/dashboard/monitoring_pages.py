@@ -36,6 +36,30 @@ def get_parallel_tracker():
     return _get_parallel_tracker()
 
 
+# Static HTML shell for the agent cards; only the values are substituted
+# per render via format_map
+_AGENT_CARD_TMPL = """
+                    <div style="
+                        border: 2px solid #00d4ff;
+                        border-radius: 10px;
+                        padding: 15px;
+                        margin: 5px;
+                        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
+                    ">
+                        <h4 style="color: #00d4ff; margin: 0;">🤖 {role}</h4>
+                        <p style="color: #888; font-size: 12px; margin: 5px 0;">
+                            ID: {agent_id}...
+                        </p>
+                        <p style="color: #4caf50; font-size: 14px;">
+                            ● {status}
+                        </p>
+                        <p style="color: #888; font-size: 11px;">
+                            Tasks: {tasks}
+                        </p>
+                    </div>
+                    """
+
+
 def render_monitoring_page():
     """Render real-time monitoring page."""
     st.title("Real-Time Monitoring")
@@ -53,7 +77,7 @@ def render_monitoring_page():
 
     try:
         tracker = get_tracker()
-        data = tracker.get_dashboard_data()
+        data = tracker.get_dashboard_data(recent_limit=10)
     except Exception as e:
         st.warning(f"Monitoring data not available: {e}")
         data = {
@@ -67,41 +91,38 @@ def render_monitoring_page():
             "recent_executions": [],
         }
 
-    # Summary metrics
+    # Summary metrics, emitted from one spec so the four widget calls are
+    # grouped instead of interleaved with other per-column work
     summary = data["summary"]
-    col1, col2, col3, col4 = st.columns(4)
+    success_rate = summary.get("success_rate", 0)
+    avg_duration = summary.get("avg_duration_ms", 0)
 
-    with col1:
-        st.metric(
-            "Active Workflows",
-            summary.get("active_workflows", 0),
-            delta=None,
-        )
-    with col2:
-        st.metric(
-            "Total Executions",
-            summary.get("total_executions", 0),
-        )
-    with col3:
-        success_rate = summary.get("success_rate", 0)
-        st.metric(
+    metrics = (
+        ("Active Workflows", summary.get("active_workflows", 0), None, "normal"),
+        ("Total Executions", summary.get("total_executions", 0), None, "normal"),
+        (
             "Success Rate",
             f"{success_rate:.1f}%",
-            delta="Good"
+            "Good"
             if success_rate >= 90
             else ("Warning" if success_rate >= 70 else "Critical"),
-            delta_color="normal"
+            "normal"
             if success_rate >= 90
             else ("off" if success_rate >= 70 else "inverse"),
-        )
-    with col4:
-        avg_duration = summary.get("avg_duration_ms", 0)
-        st.metric(
+        ),
+        (
             "Avg Duration",
             f"{avg_duration:.0f}ms"
             if avg_duration < 1000
             else f"{avg_duration / 1000:.1f}s",
-        )
+            None,
+            "normal",
+        ),
+    )
+
+    for col, (label, value, delta, delta_color) in zip(st.columns(4), metrics):
+        with col:
+            st.metric(label, value, delta=delta, delta_color=delta_color)
 
     st.divider()
 
@@ -136,7 +157,7 @@ def render_monitoring_page():
     recent = data.get("recent_executions", [])
 
     if recent:
-        for execution in recent[:10]:
+        for execution in recent:
             with st.expander(
                 f"{'✅' if execution['status'] == 'completed' else '❌'} "
                 f"{execution['workflow_name']} - {execution['execution_id'][:16]}..."
@@ -159,12 +180,14 @@ def render_monitoring_page():
                 # Show steps
                 if execution.get("steps"):
                     st.markdown("**Steps:**")
-                    for step in execution["steps"]:
-                        step_status = "✅" if step["status"] == "success" else "❌"
-                        st.text(
-                            f"  {step_status} {step['step_id']} ({step['step_type']}:{step['action']}) "
+                    st.text(
+                        "\n".join(
+                            f"  {'✅' if step['status'] == 'success' else '❌'} "
+                            f"{step['step_id']} ({step['step_type']}:{step['action']}) "
                             f"- {step['duration_ms']:.0f}ms"
+                            for step in execution["steps"]
                         )
+                    )
     else:
         st.info("No recent executions")
 
@@ -202,26 +225,14 @@ def render_agents_page():
         for i, agent in enumerate(active_agents):
             with cols[i % 4]:
                 st.markdown(
-                    f"""
-                    <div style="
-                        border: 2px solid #00d4ff;
-                        border-radius: 10px;
-                        padding: 15px;
-                        margin: 5px;
-                        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-                    ">
-                        <h4 style="color: #00d4ff; margin: 0;">🤖 {agent["role"].title()}</h4>
-                        <p style="color: #888; font-size: 12px; margin: 5px 0;">
-                            ID: {agent["agent_id"][:12]}...
-                        </p>
-                        <p style="color: #4caf50; font-size: 14px;">
-                            ● {agent["status"].upper()}
-                        </p>
-                        <p style="color: #888; font-size: 11px;">
-                            Tasks: {agent.get("tasks_completed", 0)}
-                        </p>
-                    </div>
-                    """,
+                    _AGENT_CARD_TMPL.format_map(
+                        {
+                            "role": agent["role"].title(),
+                            "agent_id": agent["agent_id"][:12],
+                            "status": agent["status"].upper(),
+                            "tasks": agent.get("tasks_completed", 0),
+                        }
+                    ),
                     unsafe_allow_html=True,
                 )
     else:
@@ -349,20 +360,19 @@ def render_metrics_page():
     recent = data.get("recent_executions", [])
 
     if recent:
-        # Extract token data
+        # Build the frame columnar with the index in place, skipping the
+        # intermediate row dicts and the set_index copy on every rerun
         import pandas as pd
 
-        token_data = [
-            {
-                "execution": ex["execution_id"][:8],
-                "tokens": ex.get("total_tokens", 0),
-            }
-            for ex in recent[:20]
-        ]
-
-        if token_data and any(d["tokens"] > 0 for d in token_data):
-            df = pd.DataFrame(token_data)
-            st.bar_chart(df.set_index("execution")["tokens"])
+        window = recent[:20]
+        tokens = [ex.get("total_tokens", 0) for ex in window]
+
+        if any(tokens):
+            df = pd.DataFrame(
+                {"tokens": tokens},
+                index=[ex["execution_id"][:8] for ex in window],
+            )
+            st.bar_chart(df["tokens"])
         else:
             st.info("No token usage data recorded")
     else:
@@ -664,12 +674,10 @@ def _render_final_output(output):
         if numeric_counters:
             st.markdown("### Key Metrics")
             df = pd.DataFrame(
-                {
-                    "Metric": list(numeric_counters.keys()),
-                    "Value": list(numeric_counters.values()),
-                }
+                {"Value": list(numeric_counters.values())},
+                index=list(numeric_counters.keys()),
             )
-            st.bar_chart(df.set_index("Metric"))
+            st.bar_chart(df)
 
     # Findings table
     if findings:
@@ -963,21 +971,24 @@ def _render_active_execution(execution: dict):
         branches = execution.get("branches", [])
         if branches:
             with st.expander(f"View {len(branches)} branches"):
-                for branch in branches[:20]:  # Limit to 20
-                    branch_status = branch.get("status", "unknown")
-                    status_icon = {
-                        "pending": "⏳",
-                        "running": "🏃",
-                        "completed": "✅",
-                        "failed": "❌",
-                        "cancelled": "🚫",
-                    }.get(branch_status, "❓")
-
-                    st.text(
-                        f"  {status_icon} {branch.get('branch_id', 'unknown')[:20]} "
+                # One st.text with the joined lines instead of a widget
+                # message per branch
+                icons = {
+                    "pending": "⏳",
+                    "running": "🏃",
+                    "completed": "✅",
+                    "failed": "❌",
+                    "cancelled": "🚫",
+                }
+                st.text(
+                    "\n".join(
+                        f"  {icons.get(branch.get('status', 'unknown'), '❓')} "
+                        f"{branch.get('branch_id', 'unknown')[:20]} "
                         f"[{branch.get('item_index', 0)}] - "
                         f"{branch.get('duration_ms', 0):.0f}ms"
+                        for branch in branches[:20]  # Limit to 20
                     )
+                )
 
         st.divider()
 
@@ -1089,12 +1100,10 @@ def _render_performance_stats(summary: dict):
         import pandas as pd
 
         df = pd.DataFrame(
-            {
-                "Pattern": list(pattern_counts.keys()),
-                "Count": list(pattern_counts.values()),
-            }
+            {"Count": list(pattern_counts.values())},
+            index=list(pattern_counts.keys()),
         )
-        st.bar_chart(df.set_index("Pattern"))
+        st.bar_chart(df)
 
 
 def render_parallel_status_sidebar():
@@ -21,6 +21,7 @@ from test_ai.http.client import (
     get_async_client,
     close_sync_client,
     close_async_client,
+    install_uvloop,
     HTTPClientConfig,
 )
 
@@ -29,5 +30,6 @@ __all__ = [
     "get_async_client",
     "close_sync_client",
     "close_async_client",
+    "install_uvloop",
     "HTTPClientConfig",
 ]
@@ -95,7 +95,7 @@ class JobManager:
 
     def _load_recent_jobs(self, limit: int = 100):
         """Load recent jobs from database on startup."""
-        rows = self.backend.fetchall(
+        rows = self.backend.fetchiter(
             """
             SELECT * FROM jobs
             ORDER BY created_at DESC
@@ -105,7 +105,9 @@ class JobManager:
         )
         for row in rows:
             try:
-                job = Job(
+                # Rows were written by this application, so skip pydantic
+                # re-validation on reload; the fields are coerced explicitly
+                job = Job.model_construct(
                     id=row["id"],
                     workflow_id=row["workflow_id"],
                     status=JobStatus(row["status"]),
@@ -125,20 +127,18 @@ class JobManager:
                     self._update_job_in_db(job)
                 self._jobs[job.id] = job
             except Exception as e:
-                logger.error(f"Failed to load job from row: {e}")
+                logger.error("Failed to load job from row: %s", e)
 
     def _save_job(self, job: Job) -> bool:
         """Save job to database (insert or update)."""
         try:
-            existing = self.backend.fetchone(
-                "SELECT id FROM jobs WHERE id = ?", (job.id,)
-            )
-            if existing:
-                return self._update_job_in_db(job)
-            else:
-                return self._insert_job_in_db(job)
+            # Try the update first and let rowcount report existence,
+            # instead of a separate SELECT round-trip before every write
+            if self._update_job_in_db(job, insert_if_missing=False):
+                return True
+            return self._insert_job_in_db(job)
         except Exception as e:
-            logger.error(f"Failed to save job {job.id}: {e}")
+            logger.error("Failed to save job %s: %s", job.id, e)
             return False
 
     def _insert_job_in_db(self, job: Job) -> bool:
@@ -167,14 +167,21 @@ class JobManager:
                 )
             return True
         except Exception as e:
-            logger.error(f"Failed to insert job {job.id}: {e}")
+            logger.error("Failed to insert job %s: %s", job.id, e)
             return False
 
-    def _update_job_in_db(self, job: Job) -> bool:
-        """Update an existing job in the database."""
+    def _update_job_in_db(self, job: Job, insert_if_missing: bool = True) -> bool:
+        """Update an existing job in the database.
+
+        Args:
+            job: Job to persist
+            insert_if_missing: When False, report a missing row via the
+                return value (cursor rowcount) instead of treating the
+                no-op update as success
+        """
         try:
             with self.backend.transaction():
-                self.backend.execute(
+                cursor = self.backend.execute(
                     """
                     UPDATE jobs
                     SET workflow_id = ?, status = ?, started_at = ?, completed_at = ?,
@@ -193,9 +200,11 @@ class JobManager:
                         job.id,
                     ),
                 )
+                if not insert_if_missing and cursor.rowcount == 0:
+                    return False
             return True
         except Exception as e:
-            logger.error(f"Failed to update job {job.id}: {e}")
+            logger.error("Failed to update job %s: %s", job.id, e)
             return False
 
     def _execute_workflow(self, job_id: str):
@@ -238,7 +247,7 @@ class JobManager:
                 self._save_job(job)
 
         except Exception as e:
-            logger.error(f"Job {job_id} failed: {e}")
+            logger.error("Job %s failed: %s", job_id, e)
             with self._lock:
                 job.status = JobStatus.FAILED
                 job.error = str(e)
@@ -265,7 +274,7 @@ class JobManager:
         future = self.executor.submit(self._execute_workflow, job.id)
         self._futures[job.id] = future
 
-        logger.info(f"Submitted job {job.id} for workflow {workflow_id}")
+        logger.info("Submitted job %s for workflow %s", job.id, workflow_id)
         return job
 
     def get_job(self, job_id: str) -> Optional[Job]:
@@ -312,7 +321,7 @@ class JobManager:
         if future:
             future.cancel()
 
-        logger.info(f"Cancelled job {job_id}")
+        logger.info("Cancelled job %s", job_id)
         return True
 
     def delete_job(self, job_id: str) -> bool:
@@ -334,7 +343,7 @@ class JobManager:
                 with self.backend.transaction():
                     self.backend.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
             except Exception as e:
-                logger.error(f"Failed to delete job {job_id} from database: {e}")
+                logger.error("Failed to delete job %s from database: %s", job_id, e)
 
         return True
 
@@ -377,9 +386,9 @@ class JobManager:
                             ),
                         )
                 except Exception as e:
-                    logger.error(f"Failed to cleanup old jobs from database: {e}")
+                    logger.error("Failed to cleanup old jobs from database: %s", e)
 
-        logger.info(f"Cleaned up {deleted} old jobs")
+        logger.info("Cleaned up %d old jobs", deleted)
         return deleted
 
     def shutdown(self, wait: bool = True):
@@ -282,6 +282,32 @@ class CostTracker:
             e.cost_usd for e in self.entries if e.timestamp.date() == date.date()
         )
 
+    def get_daily_costs(self, days: int = 7) -> Dict[str, float]:
+        """Get per-day totals for the last N days in one pass.
+
+        Calling get_daily_cost per day rescans every entry for each day
+        (O(days * entries)); this buckets all entries by date in a single
+        scan and fills missing days with 0.0.
+
+        Args:
+            days: Number of days to include, ending today
+
+        Returns:
+            Mapping of ISO date string -> total cost, oldest day first
+        """
+        today = datetime.now().date()
+        start = today - timedelta(days=days - 1)
+
+        totals = {
+            (start + timedelta(days=i)).isoformat(): 0.0 for i in range(days)
+        }
+        for e in self.entries:
+            day = e.timestamp.date()
+            if start <= day <= today:
+                totals[day.isoformat()] += e.cost_usd
+
+        return totals
+
     def get_workflow_cost(self, workflow_id: str) -> Dict[str, Any]:
         """Get cost breakdown for a workflow.
 
@@ -368,27 +394,75 @@ class CostTracker:
         Returns:
             Cost summary
         """
+        # Trivial case: nothing tracked, skip the scan and monthly math
+        if not self.entries:
+            return {
+                "period_days": days,
+                "total_cost_usd": 0.0,
+                "total_tokens": 0,
+                "total_calls": 0,
+                "avg_cost_per_call": 0,
+                "avg_tokens_per_call": 0,
+                "by_provider": {},
+                "by_model": {},
+                "by_agent": {},
+                "budget": {
+                    "limit_usd": self.budget_limit_usd,
+                    "monthly_used_usd": 0.0,
+                    "percent_used": 0.0 if self.budget_limit_usd else None,
+                },
+                "alerts": self._alerts[-10:],
+            }
+
         cutoff = datetime.now() - timedelta(days=days)
-        entries = [e for e in self.entries if e.timestamp >= cutoff]
 
-        total_cost = sum(e.cost_usd for e in entries)
-        total_tokens = sum(e.tokens.total_tokens for e in entries)
+        # Single pass over the entries: totals and all three breakdowns.
+        # The per-breakdown helpers each rescan every entry, which adds up
+        # when the summary feeds a dashboard render.
+        total_cost = 0.0
+        total_tokens = 0
+        total_calls = 0
+        by_provider = defaultdict(lambda: {"cost": 0.0, "tokens": 0, "calls": 0})
+        by_model = defaultdict(lambda: {"cost": 0.0, "tokens": 0, "calls": 0})
+        by_agent = defaultdict(lambda: {"cost": 0.0, "tokens": 0, "calls": 0})
+
+        for e in self.entries:
+            if e.timestamp < cutoff:
+                continue
+            cost = e.cost_usd
+            tokens = e.tokens.total_tokens
+            total_cost += cost
+            total_tokens += tokens
+            total_calls += 1
+
+            for bucket in (
+                by_provider[e.provider.value],
+                by_model[e.model],
+                by_agent[e.agent_role or "unknown"],
+            ):
+                bucket["cost"] += cost
+                bucket["tokens"] += tokens
+                bucket["calls"] += 1
+
+        monthly_used = self.get_monthly_cost()
 
         return {
             "period_days": days,
             "total_cost_usd": round(total_cost, 4),
             "total_tokens": total_tokens,
-            "total_calls": len(entries),
-            "avg_cost_per_call": round(total_cost / len(entries), 6) if entries else 0,
-            "avg_tokens_per_call": total_tokens // len(entries) if entries else 0,
-            "by_provider": self._group_by_provider(entries),
-            "by_model": self.get_model_costs(days),
-            "by_agent": self.get_agent_costs(days),
+            "total_calls": total_calls,
+            "avg_cost_per_call": round(total_cost / total_calls, 6)
+            if total_calls
+            else 0,
+            "avg_tokens_per_call": total_tokens // total_calls if total_calls else 0,
+            "by_provider": dict(by_provider),
+            "by_model": dict(by_model),
+            "by_agent": dict(by_agent),
             "budget": {
                 "limit_usd": self.budget_limit_usd,
-                "monthly_used_usd": self.get_monthly_cost(),
+                "monthly_used_usd": monthly_used,
                 "percent_used": (
-                    (self.get_monthly_cost() / self.budget_limit_usd * 100)
+                    (monthly_used / self.budget_limit_usd * 100)
                     if self.budget_limit_usd
                     else None
                 ),
@@ -233,6 +233,9 @@ class TechnicalDebtRegistry:
 
     def __init__(self, backend: DatabaseBackend) -> None:
         self.backend = backend
+        # get_summary result, valid until the next write; the registry is
+        # read by dashboards far more often than it changes
+        self._summary_cache: dict[str, Any] | None = None
 
     def register(self, debt: TechnicalDebt) -> None:
         """Register a new technical debt item.
@@ -240,6 +243,7 @@ class TechnicalDebtRegistry:
         Args:
             debt: The technical debt item to register.
         """
+        self._summary_cache = None
         with self.backend.transaction():
             self.backend.execute(
                 """INSERT OR IGNORE INTO technical_debt
@@ -266,6 +270,7 @@ class TechnicalDebtRegistry:
             debt_id: ID of the debt item.
             resolution: Description of the resolution.
         """
+        self._summary_cache = None
         now = datetime.now(timezone.utc).isoformat()
         with self.backend.transaction():
             self.backend.execute(
@@ -282,6 +287,7 @@ class TechnicalDebtRegistry:
             debt_id: ID of the debt item.
             status: New status.
         """
+        self._summary_cache = None
         with self.backend.transaction():
             self.backend.execute(
                 "UPDATE technical_debt SET status = ? WHERE id = ?",
@@ -313,6 +319,9 @@ class TechnicalDebtRegistry:
         Returns:
             Summary with counts by severity and category.
         """
+        if self._summary_cache is not None:
+            return dict(self._summary_cache)
+
         rows = self.backend.fetchall(
             """SELECT severity, COUNT(*) as count
                FROM technical_debt
@@ -330,11 +339,12 @@ class TechnicalDebtRegistry:
         by_category = {r["category"]: r["count"] for r in rows}
 
         total = sum(by_severity.values())
-        return {
+        self._summary_cache = {
             "total_open": total,
             "by_severity": by_severity,
             "by_category": by_category,
         }
+        return dict(self._summary_cache)
 
 
 class SystemAuditor:
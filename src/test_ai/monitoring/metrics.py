@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import atexit
+import logging
+import queue
 import sqlite3
 import threading
 from collections import defaultdict
@@ -10,8 +13,15 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+# Rows per multi-row INSERT, bounded by SQLite's 999-parameter limit at
+# 10 bound columns per step row
+_STEP_INSERT_CHUNK = 99
+
+
+@dataclass(slots=True)
 class StepMetrics:
     """Metrics for a single workflow step execution."""
 
@@ -49,7 +59,7 @@ class StepMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowMetrics:
     """Metrics for a workflow execution."""
 
@@ -142,6 +152,18 @@ class MetricsStore:
 
         if db_path:
             self._init_db()
+            # Completions enqueue here and a single background writer
+            # drains bursts into one connection/commit, so the workflow
+            # completion path never waits on an fsync
+            self._persist_queue: queue.Queue = queue.Queue()
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name="metrics-writer", daemon=True
+            )
+            self._writer_thread.start()
+            # The writer is a daemon thread, so drain any queued
+            # completions on clean interpreter exit; short-lived CLI runs
+            # would otherwise drop their final workflow's metrics
+            atexit.register(self.flush)
 
     def _init_db(self):
         """Initialize SQLite database for persistence."""
@@ -221,9 +243,9 @@ class MetricsStore:
                     self._counters["workflows_failed"] += 1
                 self._timings["workflow_duration"].append(wf.duration_ms)
 
-                # Persist if configured
+                # Persist if configured (handed to the background writer)
                 if self._db_path:
-                    self._persist_workflow(wf)
+                    self._persist_queue.put(wf)
 
                 del self._workflows[execution_id]
 
@@ -256,9 +278,43 @@ class MetricsStore:
                 if status == "failed":
                     self._counters["steps_failed"] += 1
 
-    def _persist_workflow(self, wf: WorkflowMetrics):
-        """Persist workflow to SQLite."""
+    def flush(self) -> None:
+        """Block until all queued workflow writes have been persisted."""
+        if self._db_path:
+            self._persist_queue.join()
+
+    def _writer_loop(self) -> None:
+        """Drain completed workflows and persist them in batches."""
+        while True:
+            batch = [self._persist_queue.get()]
+            # Pick up whatever else a burst queued so one connection and
+            # one commit cover it
+            while len(batch) < 100:
+                try:
+                    batch.append(self._persist_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._persist_batch(batch)
+            except Exception:
+                logger.exception("Failed to persist workflow metrics batch")
+            finally:
+                for _ in batch:
+                    self._persist_queue.task_done()
+
+    def _persist_batch(self, batch: list[WorkflowMetrics]) -> None:
+        """Persist a batch of workflows over one connection/commit."""
         conn = sqlite3.connect(self._db_path)
+        try:
+            for wf in batch:
+                self._write_workflow(conn, wf)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _write_workflow(self, conn: sqlite3.Connection, wf: WorkflowMetrics):
+        """Write one workflow and its steps on an open connection."""
         conn.execute(
             """
             INSERT INTO workflow_executions
@@ -283,14 +339,8 @@ class MetricsStore:
             ),
         )
 
-        for step in wf.steps:
-            conn.execute(
-                """
-                INSERT INTO step_executions
-                (execution_id, step_id, step_type, action, started_at, completed_at,
-                 duration_ms, status, tokens_used, error)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        if wf.steps:
+            rows = [
                 (
                     wf.execution_id,
                     step.step_id,
@@ -302,11 +352,24 @@ class MetricsStore:
                     step.status,
                     step.tokens_used,
                     step.error,
-                ),
-            )
-
-        conn.commit()
-        conn.close()
+                )
+                for step in wf.steps
+            ]
+            # Expand multi-row VALUES so the VDBE iterates rows internally
+            # instead of one statement dispatch per row, chunked to stay
+            # under SQLite's bound-parameter limit
+            for start in range(0, len(rows), _STEP_INSERT_CHUNK):
+                chunk = rows[start : start + _STEP_INSERT_CHUNK]
+                placeholders = ",".join(
+                    ["(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(chunk)
+                )
+                conn.execute(
+                    "INSERT INTO step_executions "
+                    "(execution_id, step_id, step_type, action, started_at, "
+                    "completed_at, duration_ms, status, tokens_used, error) "
+                    f"VALUES {placeholders}",
+                    [value for row in chunk for value in row],
+                )
 
     def get_active_workflows(self) -> list[dict]:
         """Get currently running workflows."""
@@ -355,11 +418,13 @@ class MetricsStore:
         with self._lock:
             for wf in self._recent_executions:
                 for step in wf.steps:
-                    key = f"{step.step_type}:{step.action}"
-                    step_stats[key]["count"] += 1
-                    step_stats[key]["total_ms"] += step.duration_ms
+                    # Resolve the bucket once per step instead of three
+                    # defaultdict lookups
+                    stats = step_stats[f"{step.step_type}:{step.action}"]
+                    stats["count"] += 1
+                    stats["total_ms"] += step.duration_ms
                     if step.status == "failed":
-                        step_stats[key]["failures"] += 1
+                        stats["failures"] += 1
 
         # Calculate averages
         result = {}
@@ -381,6 +446,9 @@ class MetricsStore:
         if not self._db_path:
             return self.get_recent_executions()
 
+        # Read-your-writes: make sure queued completions have landed
+        self.flush()
+
         cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).isoformat()
 
         conn = sqlite3.connect(self._db_path)
@@ -145,12 +145,18 @@ class ExecutionTracker:
             "current_execution": self._current_execution,
         }
 
-    def get_dashboard_data(self) -> dict:
-        """Get all data needed for dashboard display."""
+    def get_dashboard_data(self, recent_limit: int = 20) -> dict:
+        """Get all data needed for dashboard display.
+
+        Args:
+            recent_limit: How many recent executions to include; callers
+                that render fewer rows should request fewer so the store
+                serializes only what is displayed
+        """
         return {
             "summary": self.store.get_summary(),
             "active_workflows": self.store.get_active_workflows(),
-            "recent_executions": self.store.get_recent_executions(20),
+            "recent_executions": self.store.get_recent_executions(recent_limit),
             "step_performance": self.store.get_step_performance(),
         }
 
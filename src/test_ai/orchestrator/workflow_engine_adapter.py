@@ -154,6 +154,8 @@ class WorkflowEngineAdapter:
             budget_manager=budget_manager,
             dry_run=dry_run,
         )
+        # Parsed workflow JSON keyed by id, validated against file mtime
+        self._workflow_cache: dict[str, tuple[float, dict]] = {}
         logger.info(
             "Using WorkflowEngineAdapter - consider migrating to WorkflowExecutor directly"
         )
@@ -217,6 +219,10 @@ class WorkflowEngineAdapter:
     def load_workflow(self, workflow_id: str) -> Optional[Workflow]:
         """Load a workflow definition from JSON file.
 
+        Serves from the parse cache populated by list_workflows when the
+        file is unchanged, so a list-then-load sequence (the dashboard's
+        select-and-execute flow) reads each file once.
+
         Args:
             workflow_id: ID of workflow to load
 
@@ -228,8 +234,15 @@ class WorkflowEngineAdapter:
             file_path = settings.workflows_dir / f"{workflow_id}.json"
             if not file_path.exists():
                 return None
+
+            mtime = file_path.stat().st_mtime
+            cached = self._workflow_cache.get(workflow_id)
+            if cached is not None and cached[0] == mtime:
+                return Workflow(**cached[1])
+
             with open(file_path, "r") as f:
                 data = json.load(f)
+            self._workflow_cache[workflow_id] = (mtime, data)
             return Workflow(**data)
         except Exception as e:
             logger.error(f"Failed to load workflow {workflow_id}: {e}")
@@ -250,9 +263,17 @@ class WorkflowEngineAdapter:
             try:
                 with open(file_path, "r") as f:
                     data = json.load(f)
+                workflow_id = data.get("id")
+                if workflow_id:
+                    # Keep the full parse so a follow-up load_workflow of a
+                    # listed entry doesn't re-read the file
+                    self._workflow_cache[workflow_id] = (
+                        file_path.stat().st_mtime,
+                        data,
+                    )
                 workflows.append(
                     {
-                        "id": data.get("id"),
+                        "id": workflow_id,
                         "name": data.get("name"),
                         "description": data.get("description"),
                     }
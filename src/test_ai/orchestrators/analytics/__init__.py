@@ -2,53 +2,56 @@
 
 Provides modular pipeline components for data collection, analysis,
 visualization, and reporting workflows.
+
+Symbols are imported lazily (PEP 562, matching test_ai.api_clients) so
+touching the package for one component does not pay the import cost of
+every pipeline stage.
 """
 
-from .pipeline import AnalyticsPipeline, PipelineStage, PipelineResult
-from .collectors import (
-    DataCollector,
-    JSONCollector,
-    AggregateCollector,
-    CollectedData,
-    ExecutionMetricsCollector,
-    HistoricalMetricsCollector,
-    APIClientMetricsCollector,
-    BudgetMetricsCollector,
-)
-from .analyzers import (
-    DataAnalyzer,
-    AnalysisResult,
-    TrendAnalyzer,
-    ThresholdAnalyzer,
-    CompositeAnalyzer,
-)
-from .visualizers import ChartGenerator, DashboardBuilder
-from .reporters import ReportGenerator, AlertGenerator
-
-__all__ = [
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
     # Pipeline
-    "AnalyticsPipeline",
-    "PipelineStage",
-    "PipelineResult",
+    "AnalyticsPipeline": "pipeline",
+    "PipelineStage": "pipeline",
+    "PipelineResult": "pipeline",
     # Collectors
-    "DataCollector",
-    "CollectedData",
-    "JSONCollector",
-    "AggregateCollector",
-    "ExecutionMetricsCollector",
-    "HistoricalMetricsCollector",
-    "APIClientMetricsCollector",
-    "BudgetMetricsCollector",
+    "DataCollector": "collectors",
+    "CollectedData": "collectors",
+    "JSONCollector": "collectors",
+    "AggregateCollector": "collectors",
+    "ExecutionMetricsCollector": "collectors",
+    "HistoricalMetricsCollector": "collectors",
+    "APIClientMetricsCollector": "collectors",
+    "BudgetMetricsCollector": "collectors",
     # Analyzers
-    "DataAnalyzer",
-    "AnalysisResult",
-    "TrendAnalyzer",
-    "ThresholdAnalyzer",
-    "CompositeAnalyzer",
+    "DataAnalyzer": "analyzers",
+    "AnalysisResult": "analyzers",
+    "TrendAnalyzer": "analyzers",
+    "ThresholdAnalyzer": "analyzers",
+    "CompositeAnalyzer": "analyzers",
     # Visualizers
-    "ChartGenerator",
-    "DashboardBuilder",
+    "ChartGenerator": "visualizers",
+    "DashboardBuilder": "visualizers",
     # Reporters
-    "ReportGenerator",
-    "AlertGenerator",
-]
+    "ReportGenerator": "reporters",
+    "AlertGenerator": "reporters",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    """Load pipeline components on first attribute access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Cache so subsequent accesses skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
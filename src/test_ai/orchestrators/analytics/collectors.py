@@ -10,8 +10,11 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+# Resolved once; saves an attribute load per timestamp in hot paths
+_UTC = timezone.utc
 
-@dataclass
+
+@dataclass(slots=True)
 class CollectedData:
     """Container for collected data."""
 
@@ -29,15 +32,13 @@ class CollectedData:
         ]
 
         for key, value in self.data.items():
-            lines.append(f"## {key}")
+            lines.append("## " + key)
             if isinstance(value, dict):
-                for k, v in value.items():
-                    lines.append(f"- {k}: {v}")
+                lines.extend("- %s: %s" % kv for kv in value.items())
             elif isinstance(value, list):
-                for item in value[:10]:  # Limit to 10 items
-                    lines.append(f"- {item}")
+                lines.extend("- %s" % item for item in value[:10])  # Limit to 10
                 if len(value) > 10:
-                    lines.append(f"- ... and {len(value) - 10} more")
+                    lines.append("- ... and %d more" % (len(value) - 10))
             else:
                 lines.append(str(value))
             lines.append("")
@@ -77,7 +78,7 @@ class JSONCollector(DataCollector):
 
         return CollectedData(
             source=source_name,
-            collected_at=datetime.now(timezone.utc),
+            collected_at=datetime.now(_UTC),
             data=data,
             metadata={"type": "json_passthrough"},
         )
@@ -88,6 +89,11 @@ class AggregateCollector(DataCollector):
 
     def __init__(self, collectors: list[DataCollector]):
         self.collectors = collectors
+        # All-passthrough composites can be fused into one loop without
+        # building an intermediate CollectedData (and timestamp) per child
+        self._all_passthrough = all(
+            type(collector) is JSONCollector for collector in collectors
+        )
 
     def collect(self, context: Any, config: dict) -> CollectedData:
         """Collect and aggregate data from all child collectors.
@@ -99,6 +105,21 @@ class AggregateCollector(DataCollector):
 
         aggregated_data = {}
 
+        if self._all_passthrough:
+            context_default = context if isinstance(context, dict) else {}
+            for i in range(len(self.collectors)):
+                collector_config = collector_configs.get(i, {})
+                aggregated_data[
+                    collector_config.get("source_name", "json_input")
+                ] = collector_config.get("data", context_default)
+
+            return CollectedData(
+                source="aggregate",
+                collected_at=datetime.now(_UTC),
+                data=aggregated_data,
+                metadata={"collector_count": len(self.collectors)},
+            )
+
         for i, collector in enumerate(self.collectors):
             collector_config = collector_configs.get(i, {})
             result = collector.collect(context, collector_config)
@@ -106,7 +127,7 @@ class AggregateCollector(DataCollector):
 
         return CollectedData(
             source="aggregate",
-            collected_at=datetime.now(timezone.utc),
+            collected_at=datetime.now(_UTC),
             data=aggregated_data,
             metadata={"collector_count": len(self.collectors)},
         )
@@ -151,7 +172,7 @@ class ExecutionMetricsCollector(DataCollector):
 
         return CollectedData(
             source="execution_tracker",
-            collected_at=datetime.now(timezone.utc),
+            collected_at=datetime.now(_UTC),
             data=data,
             metadata={
                 "type": "execution_metrics",
@@ -233,7 +254,7 @@ class HistoricalMetricsCollector(DataCollector):
 
         return CollectedData(
             source="historical_metrics",
-            collected_at=datetime.now(timezone.utc),
+            collected_at=datetime.now(_UTC),
             data=data,
             metadata={
                 "type": "historical",
@@ -374,7 +395,7 @@ class APIClientMetricsCollector(DataCollector):
 
         return CollectedData(
             source="api_client_metrics",
-            collected_at=datetime.now(timezone.utc),
+            collected_at=datetime.now(_UTC),
             data=data,
             metadata={
                 "type": "resilience_metrics",
@@ -425,7 +446,7 @@ class BudgetMetricsCollector(DataCollector):
 
         return CollectedData(
             source="budget_tracker",
-            collected_at=datetime.now(timezone.utc),
+            collected_at=datetime.now(_UTC),
             data=data,
             metadata={
                 "type": "budget_metrics",
@@ -11,6 +11,9 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Callable, Optional, TYPE_CHECKING
 
+# Resolved once; saves an attribute load per timestamp in hot paths
+_UTC = timezone.utc
+
 if TYPE_CHECKING:
     pass
 
@@ -176,7 +179,7 @@ class AnalyticsPipeline:
         result = PipelineResult(
             pipeline_id=self.pipeline_id,
             status="running",
-            started_at=datetime.now(timezone.utc),
+            started_at=datetime.now(_UTC),
         )
 
         context = initial_context or {}
@@ -228,7 +231,7 @@ class AnalyticsPipeline:
             result.status = "completed"
             result.final_output = current_output
 
-        result.completed_at = datetime.now(timezone.utc)
+        result.completed_at = datetime.now(_UTC)
         return result
 
 
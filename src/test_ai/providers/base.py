@@ -177,7 +177,7 @@ class Provider(ABC):
         Returns:
             Completion response
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.complete, request)
 
     def generate(
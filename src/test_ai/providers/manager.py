@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any, Iterator
 
 from .base import (
     Provider,
@@ -21,6 +23,39 @@ from .anthropic_provider import AnthropicProvider
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=128)
+def _request_template(
+    system_prompt: str | None, model: str | None, extra: tuple
+) -> CompletionRequest:
+    """Build a prompt-less CompletionRequest for a recurring parameter set.
+
+    Agent loops call generate() with the same system prompt/model/kwargs
+    over and over; caching the template leaves only a replace() per call.
+    """
+    return CompletionRequest(
+        prompt="", system_prompt=system_prompt, model=model, **dict(extra)
+    )
+
+
+def _build_request(
+    prompt: str, system_prompt: str | None, model: str | None, kwargs: dict[str, Any]
+) -> CompletionRequest:
+    """Construct a CompletionRequest, reusing a cached template when the
+    non-prompt parameters are hashable."""
+    try:
+        template = _request_template(
+            system_prompt, model, tuple(sorted(kwargs.items()))
+        )
+    except TypeError:
+        # Unhashable kwargs (lists, dicts); build directly
+        return CompletionRequest(
+            prompt=prompt, system_prompt=system_prompt, model=model, **kwargs
+        )
+    # Fresh metadata so cached templates never share the mutable dict
+    return replace(template, prompt=prompt, metadata={})
+
+
 # Global manager instance
 _manager: ProviderManager | None = None
 
@@ -43,7 +78,9 @@ class ProviderManager:
         """Initialize provider manager."""
         self._providers: dict[str, Provider] = {}
         self._default_provider: str | None = None
-        self._fallback_order: list[str] = []
+        # Insertion-ordered names; dict keys give O(1) membership and
+        # removal where a list paid an O(n) scan per register/unregister
+        self._fallback_order: dict[str, None] = {}
 
     def register(
         self,
@@ -94,8 +131,7 @@ class ProviderManager:
         if set_default or self._default_provider is None:
             self._default_provider = name
 
-        if name not in self._fallback_order:
-            self._fallback_order.append(name)
+        self._fallback_order.setdefault(name)
 
         return self._providers[name]
 
@@ -108,13 +144,10 @@ class ProviderManager:
         if name in self._providers:
             del self._providers[name]
 
-        if name in self._fallback_order:
-            self._fallback_order.remove(name)
+        self._fallback_order.pop(name, None)
 
         if self._default_provider == name:
-            self._default_provider = (
-                self._fallback_order[0] if self._fallback_order else None
-            )
+            self._default_provider = next(iter(self._fallback_order), None)
 
     def get(self, name: str) -> Provider | None:
         """Get a provider by name.
@@ -162,7 +195,7 @@ class ProviderManager:
         for name in order:
             if name not in self._providers:
                 raise ValueError(f"Provider not registered: {name}")
-        self._fallback_order = order.copy()
+        self._fallback_order = dict.fromkeys(order)
 
     def list_providers(self) -> list[str]:
         """List registered provider names.
@@ -186,36 +219,44 @@ class ProviderManager:
 
     def _get_providers_to_try(
         self, provider_name: str | None, use_fallback: bool
-    ) -> list[str]:
-        """Determine ordered list of providers to try."""
-        if provider_name:
-            result = [provider_name]
-            if use_fallback:
-                result.extend(p for p in self._fallback_order if p != provider_name)
-            return result
+    ) -> Iterator[tuple[str, Provider]]:
+        """Yield (name, provider) pairs in the order to try.
 
-        if self._default_provider:
-            result = [self._default_provider]
-            if use_fallback:
-                result.extend(
-                    p for p in self._fallback_order if p != self._default_provider
-                )
-            return result
-
-        return self._fallback_order.copy()
+        Lazy so the common first-try-succeeds case never materializes the
+        fallback tail; names without a live provider are skipped here so
+        the attempt loops need no missing-provider branch.
+        """
+        providers = self._providers
+        primary = provider_name or self._default_provider
+        if primary is None:
+            for name in self._fallback_order:
+                provider = providers.get(name)
+                if provider is not None:
+                    yield name, provider
+            return
+
+        provider = providers.get(primary)
+        if provider is not None:
+            yield primary, provider
+        if use_fallback:
+            for name in self._fallback_order:
+                if name != primary:
+                    provider = providers.get(name)
+                    if provider is not None:
+                        yield name, provider
 
     def _try_provider_completion(
-        self, name: str, request: CompletionRequest, use_fallback: bool
+        self,
+        name: str,
+        provider: Provider,
+        request: CompletionRequest,
+        use_fallback: bool,
     ) -> tuple[CompletionResponse | None, Exception | None]:
         """Try completion with a single provider.
 
         Returns:
             Tuple of (response, error) - response is set on success, error on failure
         """
-        provider = self._providers.get(name)
-        if not provider:
-            return None, None
-
         try:
             logger.debug(f"Attempting completion with provider: {name}")
             return provider.complete(request), None
@@ -248,8 +289,10 @@ class ProviderManager:
         providers_to_try = self._get_providers_to_try(provider_name, use_fallback)
         last_error: Exception | None = None
 
-        for name in providers_to_try:
-            response, error = self._try_provider_completion(name, request, use_fallback)
+        for name, provider in providers_to_try:
+            response, error = self._try_provider_completion(
+                name, provider, request, use_fallback
+            )
             if response:
                 return response
             if error:
@@ -258,17 +301,17 @@ class ProviderManager:
         raise ProviderError(f"All providers failed. Last error: {last_error}")
 
     async def _try_provider_completion_async(
-        self, name: str, request: CompletionRequest, use_fallback: bool
+        self,
+        name: str,
+        provider: Provider,
+        request: CompletionRequest,
+        use_fallback: bool,
     ) -> tuple[CompletionResponse | None, Exception | None]:
         """Try async completion with a single provider.
 
         Returns:
             Tuple of (response, error) - response is set on success, error on failure
         """
-        provider = self._providers.get(name)
-        if not provider:
-            return None, None
-
         try:
             logger.debug(f"Attempting async completion with provider: {name}")
             return await provider.complete_async(request), None
@@ -314,9 +357,9 @@ class ProviderManager:
         providers_to_try = self._get_providers_to_try(provider_name, use_fallback)
         last_error: Exception | None = None
 
-        for name in providers_to_try:
+        for name, provider in providers_to_try:
             response, error = await self._try_provider_completion_async(
-                name, request, use_fallback
+                name, provider, request, use_fallback
             )
             if response:
                 return response
@@ -347,12 +390,7 @@ class ProviderManager:
         Returns:
             Generated text
         """
-        request = CompletionRequest(
-            prompt=prompt,
-            system_prompt=system_prompt,
-            model=model,
-            **kwargs,
-        )
+        request = _build_request(prompt, system_prompt, model, kwargs)
         response = await self.complete_async(
             request, provider_name=provider_name, use_fallback=use_fallback
         )
@@ -380,12 +418,7 @@ class ProviderManager:
         Returns:
             Generated text
         """
-        request = CompletionRequest(
-            prompt=prompt,
-            system_prompt=system_prompt,
-            model=model,
-            **kwargs,
-        )
+        request = _build_request(prompt, system_prompt, model, kwargs)
         response = self.complete(
             request, provider_name=provider_name, use_fallback=use_fallback
         )
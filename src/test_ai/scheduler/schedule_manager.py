@@ -2,10 +2,13 @@
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
+from apscheduler.executors.pool import ThreadPoolExecutor as APSThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
@@ -84,6 +87,11 @@ class WorkflowSchedule(BaseModel):
     next_run: Optional[datetime] = Field(None, description="Next scheduled execution")
     run_count: int = Field(0, ge=0, description="Total execution count")
 
+    @cached_property
+    def job_id(self) -> str:
+        """APScheduler job id for this schedule, built once per instance."""
+        return f"schedule_{self.id}"
+
 
 class ScheduleExecutionLog(BaseModel):
     """Log entry for a scheduled execution."""
@@ -138,8 +146,26 @@ class ScheduleManager:
         self.settings = get_settings()
         self.backend = backend or get_database()
         self.workflow_engine = WorkflowEngineAdapter()
-        self.scheduler = BackgroundScheduler()
+        # Bound concurrent executions so a burst of overdue schedules
+        # cannot saturate the process; coalesce misfires into one run and
+        # never overlap instances of the same schedule
+        self.scheduler = BackgroundScheduler(
+            executors={
+                "default": APSThreadPoolExecutor(
+                    max_workers=self.settings.max_concurrent_schedules
+                )
+            },
+            job_defaults={"coalesce": True, "max_instances": 1},
+        )
         self._schedules: Dict[str, WorkflowSchedule] = {}
+        # Manual triggers run here so API callers are not blocked for the
+        # workflow's full duration
+        self._trigger_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="schedule-trigger"
+        )
+        # Hash of the last row written per schedule, to skip identical
+        # upserts (e.g. repeated saves while a schedule is paused/idle)
+        self._last_saved_hash: Dict[str, int] = {}
         self._init_schema()
 
     def _init_schema(self):
@@ -158,10 +184,11 @@ class ScheduleManager:
         if self.scheduler.running:
             self.scheduler.shutdown(wait=False)
             logger.info("Scheduler shutdown")
+        self._trigger_pool.shutdown(wait=False)
 
     def _load_all_schedules(self):
         """Load all schedules from database and register active ones."""
-        rows = self.backend.fetchall("SELECT * FROM schedules")
+        rows = self.backend.fetchiter("SELECT * FROM schedules")
         for row in rows:
             try:
                 schedule = self._row_to_schedule(row)
@@ -183,7 +210,9 @@ class ScheduleManager:
             if row.get("interval_config"):
                 interval_config = IntervalConfig(**json.loads(row["interval_config"]))
 
-            return WorkflowSchedule(
+            # Rows were written by this application with validated models,
+            # so skip pydantic re-validation; fields are coerced explicitly
+            return WorkflowSchedule.model_construct(
                 id=row["id"],
                 workflow_id=row["workflow_id"],
                 name=row["name"],
@@ -203,22 +232,17 @@ class ScheduleManager:
             return None
 
     def _save_schedule(self, schedule: WorkflowSchedule) -> bool:
-        """Save a schedule to database (insert or update)."""
-        try:
-            existing = self.backend.fetchone(
-                "SELECT id FROM schedules WHERE id = ?", (schedule.id,)
-            )
-            if existing:
-                return self._update_schedule_in_db(schedule)
-            else:
-                return self._insert_schedule_in_db(schedule)
-        except Exception as e:
-            logger.error(f"Failed to save schedule {schedule.id}: {e}")
-            return False
+        """Save a schedule to database (insert or update).
 
-    def _insert_schedule_in_db(self, schedule: WorkflowSchedule) -> bool:
-        """Insert a new schedule into the database."""
+        A single upsert statement; the previous SELECT-then-branch issued
+        up to three statements per save.
+        """
         try:
+            params = self._schedule_row(schedule)
+            row_hash = hash(params)
+            if self._last_saved_hash.get(schedule.id) == row_hash:
+                return True  # Nothing changed since the last write
+
             with self.backend.transaction():
                 self.backend.execute(
                     """
@@ -226,73 +250,53 @@ class ScheduleManager:
                     (id, workflow_id, name, description, schedule_type, cron_config,
                      interval_config, variables, status, created_at, last_run, next_run, run_count)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        workflow_id = excluded.workflow_id,
+                        name = excluded.name,
+                        description = excluded.description,
+                        schedule_type = excluded.schedule_type,
+                        cron_config = excluded.cron_config,
+                        interval_config = excluded.interval_config,
+                        variables = excluded.variables,
+                        status = excluded.status,
+                        last_run = excluded.last_run,
+                        next_run = excluded.next_run,
+                        run_count = excluded.run_count
                     """,
-                    (
-                        schedule.id,
-                        schedule.workflow_id,
-                        schedule.name,
-                        schedule.description,
-                        schedule.schedule_type.value,
-                        json.dumps(schedule.cron_config.model_dump())
-                        if schedule.cron_config
-                        else None,
-                        json.dumps(schedule.interval_config.model_dump())
-                        if schedule.interval_config
-                        else None,
-                        json.dumps(schedule.variables) if schedule.variables else None,
-                        schedule.status.value,
-                        schedule.created_at.isoformat()
-                        if schedule.created_at
-                        else None,
-                        schedule.last_run.isoformat() if schedule.last_run else None,
-                        schedule.next_run.isoformat() if schedule.next_run else None,
-                        schedule.run_count,
-                    ),
+                    params,
                 )
+            self._last_saved_hash[schedule.id] = row_hash
             return True
         except Exception as e:
-            logger.error(f"Failed to insert schedule {schedule.id}: {e}")
+            logger.error(f"Failed to save schedule {schedule.id}: {e}")
             return False
 
-    def _update_schedule_in_db(self, schedule: WorkflowSchedule) -> bool:
-        """Update an existing schedule in the database."""
-        try:
-            with self.backend.transaction():
-                self.backend.execute(
-                    """
-                    UPDATE schedules
-                    SET workflow_id = ?, name = ?, description = ?, schedule_type = ?,
-                        cron_config = ?, interval_config = ?, variables = ?, status = ?,
-                        last_run = ?, next_run = ?, run_count = ?
-                    WHERE id = ?
-                    """,
-                    (
-                        schedule.workflow_id,
-                        schedule.name,
-                        schedule.description,
-                        schedule.schedule_type.value,
-                        json.dumps(schedule.cron_config.model_dump())
-                        if schedule.cron_config
-                        else None,
-                        json.dumps(schedule.interval_config.model_dump())
-                        if schedule.interval_config
-                        else None,
-                        json.dumps(schedule.variables) if schedule.variables else None,
-                        schedule.status.value,
-                        schedule.last_run.isoformat() if schedule.last_run else None,
-                        schedule.next_run.isoformat() if schedule.next_run else None,
-                        schedule.run_count,
-                        schedule.id,
-                    ),
-                )
-            return True
-        except Exception as e:
-            logger.error(f"Failed to update schedule {schedule.id}: {e}")
-            return False
+    @staticmethod
+    def _schedule_row(schedule: WorkflowSchedule) -> tuple:
+        """Build the bound-parameter tuple for a schedule upsert."""
+        return (
+            schedule.id,
+            schedule.workflow_id,
+            schedule.name,
+            schedule.description,
+            schedule.schedule_type.value,
+            json.dumps(schedule.cron_config.model_dump())
+            if schedule.cron_config
+            else None,
+            json.dumps(schedule.interval_config.model_dump())
+            if schedule.interval_config
+            else None,
+            json.dumps(schedule.variables) if schedule.variables else None,
+            schedule.status.value,
+            schedule.created_at.isoformat() if schedule.created_at else None,
+            schedule.last_run.isoformat() if schedule.last_run else None,
+            schedule.next_run.isoformat() if schedule.next_run else None,
+            schedule.run_count,
+        )
 
     def _register_job(self, schedule: WorkflowSchedule):
         """Register a schedule with APScheduler."""
-        job_id = f"schedule_{schedule.id}"
+        job_id = schedule.job_id
 
         # Remove existing job if present
         if self.scheduler.get_job(job_id):
@@ -471,6 +475,8 @@ class ScheduleManager:
         if self.scheduler.get_job(job_id):
             self.scheduler.remove_job(job_id)
 
+        self._last_saved_hash.pop(schedule_id, None)
+
         # Remove from database (logs cascade due to FK)
         try:
             with self.backend.transaction():
@@ -490,30 +496,38 @@ class ScheduleManager:
         """Get a schedule by ID."""
         return self._schedules.get(schedule_id)
 
+    # Fields exposed by list_schedules, dumped in one C-level pass
+    _LIST_FIELDS = {
+        "id",
+        "name",
+        "workflow_id",
+        "schedule_type",
+        "status",
+        "last_run",
+        "next_run",
+        "run_count",
+    }
+
     def list_schedules(self) -> List[Dict]:
         """List all schedules."""
+        # One get_jobs() call (one jobstore lock acquisition) instead of a
+        # get_job per schedule in the loop
+        jobs_by_id = {job.id: job for job in self.scheduler.get_jobs()}
+
         schedules = []
         for schedule in self._schedules.values():
-            # Update next run time from scheduler
-            job = self.scheduler.get_job(f"schedule_{schedule.id}")
-            if job and job.next_run_time:
-                schedule.next_run = job.next_run_time
-
+            # Update next run time from scheduler. Pending jobs (scheduler
+            # not yet started) have no next_run_time attribute, unlike
+            # jobstore-backed ones
+            job = jobs_by_id.get(schedule.job_id)
+            next_run_time = getattr(job, "next_run_time", None)
+            if next_run_time:
+                schedule.next_run = next_run_time
+
+            # model_dump handles the enum .value and isoformat conversions
+            # in one pass instead of per-field ternaries
             schedules.append(
-                {
-                    "id": schedule.id,
-                    "name": schedule.name,
-                    "workflow_id": schedule.workflow_id,
-                    "schedule_type": schedule.schedule_type.value,
-                    "status": schedule.status.value,
-                    "last_run": schedule.last_run.isoformat()
-                    if schedule.last_run
-                    else None,
-                    "next_run": schedule.next_run.isoformat()
-                    if schedule.next_run
-                    else None,
-                    "run_count": schedule.run_count,
-                }
+                schedule.model_dump(mode="json", include=self._LIST_FIELDS)
             )
         return schedules
 
@@ -555,13 +569,18 @@ class ScheduleManager:
         return True
 
     def trigger_now(self, schedule_id: str) -> bool:
-        """Manually trigger a scheduled workflow immediately."""
+        """Manually trigger a scheduled workflow immediately.
+
+        The execution is submitted to a worker pool, so the caller gets an
+        acknowledgment in milliseconds instead of blocking for the
+        workflow's duration.
+        """
         schedule = self._schedules.get(schedule_id)
         if not schedule:
             return False
 
         # Execute in background
-        self._execute_scheduled_workflow(schedule_id)
+        self._trigger_pool.submit(self._execute_scheduled_workflow, schedule_id)
         return True
 
     def get_execution_history(
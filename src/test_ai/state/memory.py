@@ -202,9 +202,13 @@ class AgentMemory:
         where_clause = " AND ".join(conditions)
         params.append(limit)
 
+        # Explicit projection: MemoryEntry never reads the (potentially
+        # large) embedding column, so don't pull it across the boundary
         rows = self.backend.fetchall(
             f"""
-            SELECT * FROM agent_memories
+            SELECT id, agent_id, workflow_id, memory_type, content, metadata,
+                   importance, created_at, accessed_at, access_count
+            FROM agent_memories
             WHERE {where_clause}
             ORDER BY importance DESC, accessed_at DESC
             LIMIT ?
@@ -437,14 +441,11 @@ class AgentMemory:
         Returns:
             Dictionary with memory stats
         """
-        total = self.backend.fetchone(
-            "SELECT COUNT(*) as count FROM agent_memories WHERE agent_id = ?",
-            (agent_id,),
-        )
-
-        by_type = self.backend.fetchall(
+        # One grouped scan; the total and overall average derive from the
+        # per-type counts and importance sums
+        rows = self.backend.fetchall(
             """
-            SELECT memory_type, COUNT(*) as count
+            SELECT memory_type, COUNT(*) as count, SUM(importance) as importance_sum
             FROM agent_memories
             WHERE agent_id = ?
             GROUP BY memory_type
@@ -452,17 +453,13 @@ class AgentMemory:
             (agent_id,),
         )
 
-        avg_importance = self.backend.fetchone(
-            "SELECT AVG(importance) as avg FROM agent_memories WHERE agent_id = ?",
-            (agent_id,),
-        )
+        total = sum(row["count"] for row in rows)
+        importance_sum = sum(row["importance_sum"] or 0 for row in rows)
 
         return {
-            "total_memories": total["count"] if total else 0,
-            "by_type": {row["memory_type"]: row["count"] for row in by_type},
-            "average_importance": round(avg_importance["avg"] or 0, 2)
-            if avg_importance
-            else 0,
+            "total_memories": total,
+            "by_type": {row["memory_type"]: row["count"] for row in rows},
+            "average_importance": round(importance_sum / total, 2) if total else 0,
         }
 
     def format_context(self, memories: dict[str, list[MemoryEntry]]) -> str:
@@ -414,16 +414,15 @@ class StatePersistence:
         Returns:
             Dictionary with workflow counts by status
         """
-        total_row = self.backend.fetchone("SELECT COUNT(*) as count FROM workflows")
-        total = total_row["count"] if total_row else 0
-
-        by_status = {}
-        for status in WorkflowStatus:
-            count_row = self.backend.fetchone(
-                "SELECT COUNT(*) as count FROM workflows WHERE status = ?",
-                (status.value,),
-            )
-            by_status[status.value] = count_row["count"] if count_row else 0
+        # One GROUP BY instead of a COUNT query per status
+        status_rows = self.backend.fetchall(
+            "SELECT status, COUNT(*) as count FROM workflows GROUP BY status"
+        )
+        counts = {row["status"]: row["count"] for row in status_rows}
+        total = sum(counts.values())
+        by_status = {
+            status.value: counts.get(status.value, 0) for status in WorkflowStatus
+        }
 
         checkpoint_row = self.backend.fetchone(
             "SELECT COUNT(*) as count FROM checkpoints"
@@ -11,7 +11,7 @@ import logging
 import random
 import time
 from dataclasses import dataclass, field
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Awaitable, Callable, Tuple, Type, TypeVar
 
 from test_ai.errors import APIError, MaxRetriesError
@@ -55,7 +55,9 @@ class RetryConfig:
         return delay
 
 
-# Default retryable exceptions for common SDK errors
+# Default retryable exceptions for common SDK errors, resolved lazily so
+# importing this module does not pull in every provider SDK.
+@lru_cache(maxsize=1)
 def _get_retryable_exceptions() -> Tuple[Type[Exception], ...]:
     """Build tuple of retryable exception types from available SDKs."""
     exceptions: list[Type[Exception]] = [
@@ -122,13 +124,17 @@ def _get_retryable_exceptions() -> Tuple[Type[Exception], ...]:
     return tuple(exceptions)
 
 
-DEFAULT_RETRYABLE_EXCEPTIONS = _get_retryable_exceptions()
+def __getattr__(name: str):
+    """Resolve DEFAULT_RETRYABLE_EXCEPTIONS lazily (PEP 562)."""
+    if name == "DEFAULT_RETRYABLE_EXCEPTIONS":
+        return _get_retryable_exceptions()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def is_retryable_error(exc: Exception) -> bool:
     """Check if an exception represents a retryable error."""
     # Check if it's a known retryable exception type
-    if isinstance(exc, DEFAULT_RETRYABLE_EXCEPTIONS):
+    if isinstance(exc, _get_retryable_exceptions()):
         return True
 
     # Check for Gorgon APIError with retryable status code
@@ -183,7 +189,7 @@ def with_retry(
         max_delay=max_delay,
         exponential_base=exponential_base,
         jitter=jitter,
-        retryable_exceptions=retryable_exceptions or DEFAULT_RETRYABLE_EXCEPTIONS,
+        retryable_exceptions=retryable_exceptions or _get_retryable_exceptions(),
     )
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
@@ -348,7 +354,7 @@ def async_with_retry(
         max_delay=max_delay,
         exponential_base=exponential_base,
         jitter=jitter,
-        retryable_exceptions=retryable_exceptions or DEFAULT_RETRYABLE_EXCEPTIONS,
+        retryable_exceptions=retryable_exceptions or _get_retryable_exceptions(),
     )
 
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
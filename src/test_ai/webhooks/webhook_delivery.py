@@ -123,6 +123,9 @@ class WebhookDeliveryManager:
         ON webhook_deliveries(next_retry_at)
         WHERE status = 'retrying';
 
+        CREATE INDEX IF NOT EXISTS idx_deliveries_created_status
+        ON webhook_deliveries(created_at, status);
+
         CREATE TABLE IF NOT EXISTS webhook_dead_letter (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             delivery_id INTEGER NOT NULL,
@@ -92,9 +92,9 @@ def _get_openai_client():
     global _openai_client
     if _openai_client is None:
         try:
-            from test_ai.api_clients.openai_client import OpenAIClient
+            from test_ai.api_clients.openai_client import get_openai_client
 
-            _openai_client = OpenAIClient()
+            _openai_client = get_openai_client()
         except Exception:
             _openai_client = False  # Mark as unavailable
     return _openai_client if _openai_client else None
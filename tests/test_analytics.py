@@ -13,6 +13,7 @@ from test_ai.orchestrators.analytics.collectors import (
 from test_ai.orchestrators.analytics.analyzers import (
     AnalysisResult,
     CompositeAnalyzer,
+    DataAnalyzer,
     ThresholdAnalyzer,
     TrendAnalyzer,
 )
@@ -753,3 +754,118 @@ class TestPipelineStage:
         assert PipelineStage.VISUALIZE.value == "visualize"
         assert PipelineStage.REPORT.value == "report"
         assert PipelineStage.ALERT.value == "alert"
+
+
+class TestCompositeAnalyzerMemo:
+    """Tests for per-child memoization of repeated analyses."""
+
+    def test_same_snapshot_reuses_child_results(self):
+        calls = []
+
+        class CountingAnalyzer(DataAnalyzer):
+            def analyze(self, data, config):
+                calls.append(config)
+                return AnalysisResult(
+                    analyzer="counting",
+                    analyzed_at=datetime.now(timezone.utc),
+                    findings=[],
+                    metrics={},
+                    recommendations=[],
+                    severity="info",
+                )
+
+        composite = CompositeAnalyzer([CountingAnalyzer()])
+        data = CollectedData(
+            source="test",
+            collected_at=datetime.now(timezone.utc),
+            data={"a": 1},
+            metadata={},
+        )
+
+        composite.analyze(data, {})
+        composite.analyze(data, {})
+
+        assert len(calls) == 1
+
+    def test_new_snapshot_recomputes(self):
+        calls = []
+
+        class CountingAnalyzer(DataAnalyzer):
+            def analyze(self, data, config):
+                calls.append(config)
+                return AnalysisResult(
+                    analyzer="counting",
+                    analyzed_at=datetime.now(timezone.utc),
+                    findings=[],
+                    metrics={},
+                    recommendations=[],
+                    severity="info",
+                )
+
+        composite = CompositeAnalyzer([CountingAnalyzer()])
+        data1 = CollectedData(
+            source="test",
+            collected_at=datetime.now(timezone.utc),
+            data={"a": 1},
+            metadata={},
+        )
+        data2 = CollectedData(
+            source="test",
+            collected_at=datetime.now(timezone.utc),
+            data={"a": 2},
+            metadata={},
+        )
+
+        composite.analyze(data1, {})
+        composite.analyze(data2, {})
+
+        assert len(calls) == 2
+
+    def test_config_change_recomputes(self):
+        calls = []
+
+        class CountingAnalyzer(DataAnalyzer):
+            def analyze(self, data, config):
+                calls.append(config)
+                return AnalysisResult(
+                    analyzer="counting",
+                    analyzed_at=datetime.now(timezone.utc),
+                    findings=[],
+                    metrics={},
+                    recommendations=[],
+                    severity="info",
+                )
+
+        composite = CompositeAnalyzer([CountingAnalyzer()])
+        data = CollectedData(
+            source="test",
+            collected_at=datetime.now(timezone.utc),
+            data={"a": 1},
+            metadata={},
+        )
+
+        composite.analyze(data, {"analyzer_configs": {0: {"x": 1}}})
+        composite.analyze(data, {"analyzer_configs": {0: {"x": 2}}})
+
+        assert len(calls) == 2
+
+    def test_freed_object_address_reuse_not_served_stale(self):
+        """A new dict reusing a garbage-collected dict's address must not
+        hit the previous snapshot's memo entry."""
+        analyzer = CompositeAnalyzer([ThresholdAnalyzer()])
+        config = {
+            "analyzer_configs": {
+                0: {"thresholds": {"cpu": {"critical": 90, "direction": "above"}}}
+            }
+        }
+
+        data = {"cpu": 95}
+        first = analyzer.analyze(data, config)
+        assert first.severity == "critical"
+
+        # Free the first dict; CPython readily reuses the address for the
+        # next allocation of the same shape
+        del data
+        second = analyzer.analyze({"cpu": 10}, config)
+
+        assert second.severity == "info"
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, patch
 sys.path.insert(0, "src")
 
 from test_ai.state.backends import (
+    DatabaseBackend,
     SQLiteBackend,
     PostgresBackend,
     create_backend,
@@ -370,3 +371,54 @@ class TestPostgresBackend:
         conn = backend._get_conn()
         assert conn is mock_new
         backend._psycopg2.connect.assert_called_once_with(**backend._conn_params)
+
+
+class TestFetchIter:
+    """Tests for streaming row iteration."""
+
+    def test_sqlite_fetchiter_yields_dicts(self, tmp_path):
+        backend = SQLiteBackend(db_path=str(tmp_path / "iter.db"))
+        backend.executescript(
+            "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT);"
+        )
+        with backend.transaction():
+            backend.executemany(
+                "INSERT INTO items (name) VALUES (?)",
+                [("a",), ("b",), ("c",)],
+            )
+
+        rows = backend.fetchiter("SELECT * FROM items ORDER BY id")
+        import types
+
+        assert isinstance(rows, types.GeneratorType)
+        assert [row["name"] for row in rows] == ["a", "b", "c"]
+
+    def test_base_class_default_falls_back_to_fetchall(self):
+        class ListBackend(DatabaseBackend):
+            def execute(self, query, params=()):
+                pass
+
+            def executemany(self, query, params_list):
+                pass
+
+            def executescript(self, script):
+                pass
+
+            def fetchone(self, query, params=()):
+                return None
+
+            def fetchall(self, query, params=()):
+                return [{"id": 1}, {"id": 2}]
+
+            def transaction(self):
+                pass
+
+            def close(self):
+                pass
+
+            @property
+            def placeholder(self):
+                return "?"
+
+        rows = list(ListBackend().fetchiter("SELECT 1"))
+        assert rows == [{"id": 1}, {"id": 2}]
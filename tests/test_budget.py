@@ -306,3 +306,18 @@ class TestGetStrategy:
         """Unknown strategy raises ValueError."""
         with pytest.raises(ValueError):
             get_strategy("unknown")
+
+
+class TestBudgetPackageExports:
+    """The canonical budget package exposes the full public surface."""
+
+    def test_single_init_with_complete_exports(self):
+        from test_ai.budget import PreflightValidator, get_budget_tracker
+
+        assert callable(get_budget_tracker)
+        assert PreflightValidator is not None
+
+    def test_budget_tracker_is_singleton(self):
+        from test_ai.budget import get_budget_tracker
+
+        assert get_budget_tracker() is get_budget_tracker()
@@ -1,12 +1,14 @@
 """Tests for caching module."""
 
 import asyncio
+import tempfile
 import time
 from unittest.mock import patch
 
 import pytest
 
 from test_ai.cache.backends import (
+    FileCache,
     MemoryCache,
     CacheEntry,
     CacheStats,
@@ -362,3 +364,49 @@ class TestCacheAside:
         cache_aside.set_sync("key", "value")
         result = cache_aside.get_sync("key")
         assert result == "value"
+
+
+class TestGetMany:
+    """Tests for batch key retrieval."""
+
+    @pytest.mark.asyncio
+    async def test_memory_get_many(self):
+        cache = MemoryCache()
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+
+        results = await cache.get_many(["a", "b", "missing"])
+
+        assert results == {"a": 1, "b": 2}
+
+    @pytest.mark.asyncio
+    async def test_memory_get_many_skips_expired(self):
+        cache = MemoryCache()
+        await cache.set("fresh", 1)
+        await cache.set("stale", 2, ttl=1)
+        cache._cache["stale"].expires_at = time.time() - 1
+
+        results = await cache.get_many(["fresh", "stale"])
+
+        assert results == {"fresh": 1}
+        assert await cache.exists("stale") is False
+
+    @pytest.mark.asyncio
+    async def test_get_many_counts_stats(self):
+        cache = MemoryCache()
+        await cache.set("a", 1)
+
+        await cache.get_many(["a", "miss1", "miss2"])
+
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_base_default_loops_over_get(self):
+        cache = FileCache(cache_dir=tempfile.mkdtemp())
+        await cache.set("x", "one")
+        await cache.set("y", "two")
+
+        results = await cache.get_many(["x", "y", "z"])
+
+        assert results == {"x": "one", "y": "two"}
@@ -81,6 +81,9 @@ def _make_tracker():
         "budget": {},
     }
     tracker.get_daily_cost.return_value = 1.25
+    tracker.get_daily_costs.return_value = {
+        f"2025-01-0{i}": 1.25 for i in range(1, 8)
+    }
     tracker.get_monthly_cost.return_value = 12.50
     tracker.get_agent_costs.return_value = {
         "planner": {"cost": 5.0, "tokens": 200000, "calls": 80},
@@ -189,7 +192,9 @@ class TestOverviewTab:
 
     def test_daily_trend_rendered(self, mock_streamlit):
         tracker = _make_tracker()
-        tracker.get_daily_cost.return_value = 2.0
+        tracker.get_daily_costs.return_value = {
+            f"2025-01-0{i}": 2.0 for i in range(1, 8)
+        }
 
         from test_ai.dashboard.cost_dashboard import _render_overview_tab
 
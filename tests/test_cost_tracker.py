@@ -358,3 +358,34 @@ class TestGlobalTracker:
         tracker = initialize_cost_tracker(budget_limit_usd=50.0)
         assert tracker.budget_limit_usd == 50.0
         assert isinstance(tracker, CostTracker)
+
+
+class TestDailyCosts:
+    """Tests for single-pass daily bucketing."""
+
+    def test_empty_tracker_returns_zero_days(self):
+        tracker = CostTracker()
+        totals = tracker.get_daily_costs(days=3)
+        assert len(totals) == 3
+        assert all(cost == 0.0 for cost in totals.values())
+
+    def test_buckets_entries_by_day(self):
+        tracker = CostTracker()
+        tracker.track(Provider.OPENAI, "gpt-4o-mini", 1000, 500)
+        tracker.track(Provider.OPENAI, "gpt-4o-mini", 1000, 500)
+
+        totals = tracker.get_daily_costs(days=7)
+        today = datetime.now().date().isoformat()
+
+        assert len(totals) == 7
+        assert totals[today] == pytest.approx(tracker.get_daily_cost())
+        # Oldest day first
+        assert list(totals)[-1] == today
+
+    def test_old_entries_excluded(self):
+        tracker = CostTracker()
+        entry = tracker.track(Provider.OPENAI, "gpt-4o-mini", 1000, 500)
+        entry.timestamp = datetime.now() - timedelta(days=30)
+
+        totals = tracker.get_daily_costs(days=7)
+        assert all(cost == 0.0 for cost in totals.values())
@@ -98,17 +98,19 @@ class TestDashboardHelpers:
             mock_manager_class.assert_called_once()
 
     def test_get_openai_client(self, mock_streamlit):
-        """get_openai_client returns OpenAIClient instance."""
-        with patch("test_ai.api_clients.OpenAIClient") as mock_client_class:
+        """get_openai_client returns the shared OpenAIClient instance."""
+        with patch(
+            "test_ai.dashboard.app._get_shared_openai_client"
+        ) as mock_get_client:
             mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             from test_ai.dashboard.app import get_openai_client
 
             result = get_openai_client()
 
             assert result is not None
-            mock_client_class.assert_called_once()
+            mock_get_client.assert_called_once()
 
 
 class TestRenderSidebar:
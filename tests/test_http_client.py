@@ -224,3 +224,46 @@ class TestIntegrationWithWebhook:
                         mock_client.post.assert_called_once()
 
             backend.close()
+
+
+class TestHttp2AndUvloop:
+    """Tests for optional HTTP/2 and uvloop support."""
+
+    def test_http2_disabled_by_default(self):
+        config = HTTPClientConfig()
+        assert config.http2 is False
+
+    def test_http2_available_requires_request(self):
+        from test_ai.http.client import _http2_available
+
+        assert _http2_available(False) is False
+
+    def test_http2_available_guards_missing_h2(self):
+        import builtins
+
+        from test_ai.http.client import _http2_available
+
+        real_import = builtins.__import__
+
+        def no_h2(name, *args, **kwargs):
+            if name == "h2":
+                raise ImportError("no h2")
+            return real_import(name, *args, **kwargs)
+
+        with patch("builtins.__import__", side_effect=no_h2):
+            assert _http2_available(True) is False
+
+    def test_install_uvloop_without_package(self):
+        import builtins
+
+        from test_ai.http.client import install_uvloop
+
+        real_import = builtins.__import__
+
+        def no_uvloop(name, *args, **kwargs):
+            if name == "uvloop":
+                raise ImportError("no uvloop")
+            return real_import(name, *args, **kwargs)
+
+        with patch("builtins.__import__", side_effect=no_uvloop):
+            assert install_uvloop() is False
@@ -0,0 +1,153 @@
+"""Tests for the LLM response cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from test_ai.api_clients.llm_cache import (
+    LLMCache,
+    get_llm_cache,
+    reset_llm_cache,
+)
+from test_ai.cache.backends import FileCache, MemoryCache
+
+
+@pytest.fixture(autouse=True)
+def _reset_global_cache():
+    reset_llm_cache()
+    yield
+    reset_llm_cache()
+
+
+class TestCacheKey:
+    """Tests for cache key generation."""
+
+    def test_deterministic_call_gets_key(self):
+        key = LLMCache.cache_key(
+            "openai", "gpt-4o-mini", [{"role": "user", "content": "hi"}], 0.0, 100
+        )
+        assert key is not None
+        assert key.startswith("llm:openai:")
+
+    def test_same_inputs_same_key(self):
+        messages = [{"role": "user", "content": "hi"}]
+        key1 = LLMCache.cache_key("openai", "gpt-4o-mini", messages, 0.0, None)
+        key2 = LLMCache.cache_key("openai", "gpt-4o-mini", messages, 0.0, None)
+        assert key1 == key2
+
+    def test_different_model_different_key(self):
+        messages = [{"role": "user", "content": "hi"}]
+        key1 = LLMCache.cache_key("openai", "gpt-4o-mini", messages, 0.0, None)
+        key2 = LLMCache.cache_key("openai", "gpt-4o", messages, 0.0, None)
+        assert key1 != key2
+
+    def test_nonzero_temperature_uncacheable(self):
+        key = LLMCache.cache_key(
+            "openai", "gpt-4o-mini", [{"role": "user", "content": "hi"}], 0.7, None
+        )
+        assert key is None
+
+
+class TestLLMCache:
+    """Tests for get/set/stats behavior."""
+
+    def test_miss_then_hit(self):
+        cache = LLMCache(backend=MemoryCache())
+        key = LLMCache.cache_key("openai", "m", [{"role": "user", "content": "x"}], 0.0)
+
+        assert cache.get(key) is None
+        cache.set(key, "response")
+        assert cache.get(key) == "response"
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    def test_none_key_always_misses(self):
+        cache = LLMCache(backend=MemoryCache())
+        assert cache.get(None) is None
+        cache.set(None, "value")
+        assert cache.get(None) is None
+        # None keys never touch the backend, so no stats recorded
+        assert cache.stats == {"hits": 0, "misses": 0}
+
+    @pytest.mark.asyncio
+    async def test_clear_resets_stats(self):
+        cache = LLMCache(backend=MemoryCache())
+        key = LLMCache.cache_key("openai", "m", [{"role": "user", "content": "x"}], 0.0)
+        cache.set(key, "response")
+        cache.get(key)
+
+        await cache.clear()
+        assert cache.stats == {"hits": 0, "misses": 0}
+        assert cache.get(key) is None
+
+    def test_file_backend_roundtrip(self, tmp_path):
+        cache = LLMCache(backend=FileCache(cache_dir=str(tmp_path)))
+        key = LLMCache.cache_key("openai", "m", [{"role": "user", "content": "x"}], 0.0)
+        cache.set(key, "persisted")
+        assert cache.get(key) == "persisted"
+
+
+class TestGetLLMCache:
+    """Tests for the settings-gated global instance."""
+
+    def test_disabled_returns_none(self):
+        with patch("test_ai.api_clients.llm_cache.get_settings") as ms:
+            ms.return_value.llm_cache_enabled = False
+            assert get_llm_cache() is None
+
+    def test_enabled_returns_singleton(self):
+        with patch("test_ai.api_clients.llm_cache.get_settings") as ms:
+            ms.return_value.llm_cache_enabled = True
+            ms.return_value.llm_cache_ttl_seconds = 60
+            cache1 = get_llm_cache()
+            cache2 = get_llm_cache()
+            assert cache1 is not None
+            assert cache1 is cache2
+
+
+class TestClientIntegration:
+    """Cache hits skip the network call in OpenAIClient."""
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_call_api_uses_cache(self, mock_openai_cls):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        with patch("test_ai.api_clients.openai_client.get_settings") as ms:
+            ms.return_value.openai_api_key = "sk-test"
+            client = OpenAIClient()
+
+        response = MagicMock()
+        response.choices[0].message.content = "cached answer"
+        client.client.chat.completions.create.return_value = response
+
+        cache = LLMCache(backend=MemoryCache())
+        with patch(
+            "test_ai.api_clients.openai_client.get_llm_cache", return_value=cache
+        ):
+            messages = [{"role": "user", "content": "q"}]
+            first = client._call_api("gpt-4o-mini", messages, 0.0, None)
+            second = client._call_api("gpt-4o-mini", messages, 0.0, None)
+
+        assert first == second == "cached answer"
+        assert client.client.chat.completions.create.call_count == 1
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_nonzero_temperature_not_cached(self, mock_openai_cls):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        with patch("test_ai.api_clients.openai_client.get_settings") as ms:
+            ms.return_value.openai_api_key = "sk-test"
+            client = OpenAIClient()
+
+        response = MagicMock()
+        response.choices[0].message.content = "fresh answer"
+        client.client.chat.completions.create.return_value = response
+
+        cache = LLMCache(backend=MemoryCache())
+        with patch(
+            "test_ai.api_clients.openai_client.get_llm_cache", return_value=cache
+        ):
+            messages = [{"role": "user", "content": "q"}]
+            client._call_api("gpt-4o-mini", messages, 0.9, None)
+            client._call_api("gpt-4o-mini", messages, 0.9, None)
+
+        assert client.client.chat.completions.create.call_count == 2
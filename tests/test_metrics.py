@@ -491,6 +491,7 @@ class TestMetricsStoreCompleteWorkflow:
         )
         metrics_store_with_db.start_workflow(wf)
         metrics_store_with_db.complete_workflow("exec_1", "completed")
+        metrics_store_with_db.flush()
 
         conn = sqlite3.connect(metrics_store_with_db._db_path)
         cursor = conn.execute(
@@ -764,6 +765,7 @@ class TestMetricsStorePersistence:
 
         metrics_store_with_db.start_workflow(wf)
         metrics_store_with_db.complete_workflow("exec_1", "completed")
+        metrics_store_with_db.flush()
 
         conn = sqlite3.connect(metrics_store_with_db._db_path)
         cursor = conn.execute(
@@ -789,6 +791,7 @@ class TestMetricsStorePersistence:
         )
         store1.start_workflow(wf)
         store1.complete_workflow("exec_1", "completed")
+        store1.flush()
 
         # Reset singleton
         MetricsStore._instance = None
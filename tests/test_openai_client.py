@@ -1,6 +1,6 @@
 """Tests for OpenAI API client wrapper."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -9,6 +9,8 @@ import pytest
 def mock_settings():
     with patch("test_ai.api_clients.openai_client.get_settings") as ms:
         ms.return_value.openai_api_key = "sk-test"
+        ms.return_value.llm_budget_preflight_enabled = False
+        ms.return_value.llm_max_input_tokens = None
         yield ms
 
 
@@ -20,7 +22,9 @@ class TestOpenAIClient:
         from test_ai.api_clients.openai_client import OpenAIClient
 
         client = OpenAIClient()
-        mock_openai_cls.assert_called_once_with(api_key="sk-test")
+        assert mock_openai_cls.call_count == 1
+        assert mock_openai_cls.call_args.kwargs["api_key"] == "sk-test"
+        assert "http_client" in mock_openai_cls.call_args.kwargs
         assert client._async_client is None
 
     @patch("test_ai.api_clients.openai_client.AsyncOpenAI")
@@ -34,7 +38,8 @@ class TestOpenAIClient:
         assert client._async_client is None
 
         _ = client.async_client
-        mock_async_openai.assert_called_once_with(api_key="sk-test")
+        assert mock_async_openai.call_count == 1
+        assert mock_async_openai.call_args.kwargs["api_key"] == "sk-test"
 
         # Second access reuses
         _ = client.async_client
@@ -159,3 +164,371 @@ class TestOpenAIClientAsync:
         ):
             result = await client.generate_sop_async("deployment process")
             assert result == "Async SOP"
+
+
+class TestOpenAIClientBatch:
+    """Tests for batched completion generation."""
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_empty_prompts(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+        assert client.generate_completion_batch([]) == []
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_single_prompt_skips_marshaling(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+
+        with patch.object(client, "_call_api", return_value="only answer") as mock_call:
+            result = client.generate_completion_batch(["one prompt"])
+
+        assert result == ["only answer"]
+        assert mock_call.call_count == 1
+        # The prompt goes through unmarshaled
+        assert "### PROMPT" not in mock_call.call_args[0][1][-1]["content"]
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_batch_marshals_one_call(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+
+        with patch.object(
+            client, "_call_api", return_value='["answer 1", "answer 2", "answer 3"]'
+        ) as mock_call:
+            result = client.generate_completion_batch(["p1", "p2", "p3"])
+
+        assert result == ["answer 1", "answer 2", "answer 3"]
+        assert mock_call.call_count == 1
+        content = mock_call.call_args[0][1][-1]["content"]
+        assert "### PROMPT 1" in content
+        assert "### PROMPT 3" in content
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_parse_failure_falls_back_per_prompt(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+        responses = iter(["not json at all", "fallback 1", "fallback 2"])
+
+        with patch.object(
+            client, "_call_api", side_effect=lambda *a: next(responses)
+        ) as mock_call:
+            result = client.generate_completion_batch(["p1", "p2"])
+
+        assert result == ["fallback 1", "fallback 2"]
+        # One failed batch call + one call per prompt
+        assert mock_call.call_count == 3
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_wrong_length_falls_back(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+        responses = iter(['["only one"]', "fallback 1", "fallback 2"])
+
+        with patch.object(client, "_call_api", side_effect=lambda *a: next(responses)):
+            result = client.generate_completion_batch(["p1", "p2"])
+
+        assert result == ["fallback 1", "fallback 2"]
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_fenced_json_tolerated(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+
+        with patch.object(
+            client, "_call_api", return_value='```json\n["a", "b"]\n```'
+        ):
+            result = client.generate_completion_batch(["p1", "p2"])
+
+        assert result == ["a", "b"]
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_respects_batch_size(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+        responses = iter(['["a", "b"]', '["c", "d"]'])
+
+        with patch.object(
+            client, "_call_api", side_effect=lambda *a: next(responses)
+        ) as mock_call:
+            result = client.generate_completion_batch(
+                ["p1", "p2", "p3", "p4"], batch_size=2
+            )
+
+        assert result == ["a", "b", "c", "d"]
+        assert mock_call.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    async def test_batch_async_preserves_order(self, mock_openai, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+
+        async def echo(model, messages, temperature, max_tokens):
+            return f"answer to {messages[-1]['content']}"
+
+        with patch.object(client, "_call_api_async", side_effect=echo):
+            result = await client.generate_completion_batch_async(
+                ["p1", "p2", "p3"], max_concurrency=2
+            )
+
+        assert result == ["answer to p1", "answer to p2", "answer to p3"]
+
+    @pytest.mark.asyncio
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    async def test_batch_async_empty(self, mock_openai, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+        assert await client.generate_completion_batch_async([]) == []
+
+
+class TestBudgetPreflight:
+    """Tests for the local token-budget pre-flight."""
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_disabled_by_default(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        mock_settings.return_value.llm_budget_preflight_enabled = False
+        client = OpenAIClient()
+
+        response = MagicMock()
+        response.choices[0].message.content = "ok"
+        client.client.chat.completions.create.return_value = response
+
+        assert client._call_api("gpt-4o-mini", [{"role": "user", "content": "hi"}], 0.7, None) == "ok"
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_over_budget_raises_before_network(self, mock_openai_cls, mock_settings):
+        from test_ai.budget import BudgetConfig, BudgetManager
+        from test_ai.errors import BudgetExceededError
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        mock_settings.return_value.llm_budget_preflight_enabled = True
+        client = OpenAIClient()
+
+        tracker = BudgetManager(BudgetConfig(total_budget=10, reserve_tokens=0))
+        with patch("test_ai.budget.get_budget_tracker", return_value=tracker):
+            with pytest.raises(BudgetExceededError):
+                client._call_api(
+                    "gpt-4o-mini",
+                    [{"role": "user", "content": "x" * 4000}],
+                    0.7,
+                    None,
+                )
+
+        client.client.chat.completions.create.assert_not_called()
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_within_budget_records_usage(self, mock_openai_cls, mock_settings):
+        from test_ai.budget import BudgetConfig, BudgetManager
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        mock_settings.return_value.llm_budget_preflight_enabled = True
+        client = OpenAIClient()
+
+        response = MagicMock()
+        response.choices[0].message.content = "a short answer"
+        client.client.chat.completions.create.return_value = response
+
+        tracker = BudgetManager(BudgetConfig(total_budget=100000))
+        with patch("test_ai.budget.get_budget_tracker", return_value=tracker):
+            result = client._call_api(
+                "gpt-4o-mini", [{"role": "user", "content": "question"}], 0.7, None
+            )
+
+        assert result == "a short answer"
+        assert tracker.used > 0
+
+
+class TestOpenAIClientStreaming:
+    """Tests for streaming completion generation."""
+
+    @staticmethod
+    def _chunk(content):
+        chunk = MagicMock()
+        chunk.choices = [MagicMock()]
+        chunk.choices[0].delta.content = content
+        return chunk
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_stream_yields_chunks(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+        client.client.chat.completions.create.return_value = iter(
+            [self._chunk("Hel"), self._chunk("lo"), self._chunk(None)]
+        )
+
+        chunks = list(client.generate_completion_stream("Say hi"))
+
+        assert chunks == ["Hel", "lo", ""]
+        kwargs = client.client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_stream_includes_system_prompt(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+        client.client.chat.completions.create.return_value = iter([])
+
+        list(client.generate_completion_stream("Q", system_prompt="sys"))
+
+        messages = client.client.chat.completions.create.call_args.kwargs["messages"]
+        assert messages[0] == {"role": "system", "content": "sys"}
+
+    @pytest.mark.asyncio
+    @patch("test_ai.api_clients.openai_client.AsyncOpenAI")
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    async def test_stream_async_yields_chunks(
+        self, mock_openai, mock_async_openai, mock_settings
+    ):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+
+        async def aiter():
+            for c in [self._chunk("a"), self._chunk("b")]:
+                yield c
+
+        client.async_client.chat.completions.create = AsyncMock(return_value=aiter())
+
+        chunks = [
+            c async for c in client.generate_completion_stream_async("Say hi")
+        ]
+        assert chunks == ["a", "b"]
+
+
+class TestOpenAIClientOfflineBatch:
+    """Tests for Batch API submission and retrieval."""
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_submit_batch(self, mock_openai_cls, mock_settings):
+        import json as _json
+
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+        client.client.files.create.return_value = MagicMock(id="file-1")
+        client.client.batches.create.return_value = MagicMock(id="batch-1")
+
+        batch_id = client.submit_batch(
+            ["p1", "p2"], system_prompt="sys", max_tokens=50
+        )
+
+        assert batch_id == "batch-1"
+        name, payload = client.client.files.create.call_args.kwargs["file"]
+        lines = [_json.loads(line) for line in payload.decode().splitlines()]
+        assert [line["custom_id"] for line in lines] == ["prompt-0", "prompt-1"]
+        assert lines[0]["body"]["messages"][0]["role"] == "system"
+        assert lines[0]["body"]["max_tokens"] == 50
+        kwargs = client.client.batches.create.call_args.kwargs
+        assert kwargs["input_file_id"] == "file-1"
+        assert kwargs["completion_window"] == "24h"
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_fetch_batch_in_progress(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+        client.client.batches.retrieve.return_value = MagicMock(status="in_progress")
+
+        assert client.fetch_batch("batch-1") is None
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_fetch_batch_failed_raises(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+        client.client.batches.retrieve.return_value = MagicMock(status="failed")
+
+        with pytest.raises(RuntimeError, match="failed"):
+            client.fetch_batch("batch-1")
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_fetch_batch_completed_ordered(self, mock_openai_cls, mock_settings):
+        import json as _json
+
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        client = OpenAIClient()
+        client.client.batches.retrieve.return_value = MagicMock(
+            status="completed", output_file_id="file-out"
+        )
+        # Results can come back out of submission order
+        lines = [
+            {
+                "custom_id": f"prompt-{i}",
+                "response": {
+                    "body": {"choices": [{"message": {"content": f"answer {i}"}}]}
+                },
+            }
+            for i in (1, 0)
+        ]
+        client.client.files.content.return_value = MagicMock(
+            text="\n".join(_json.dumps(line) for line in lines)
+        )
+
+        assert client.fetch_batch("batch-1") == ["answer 0", "answer 1"]
+
+
+class TestTruncateMiddle:
+    """Tests for tokenizer-aware input truncation."""
+
+    def test_no_limit_returns_unchanged(self):
+        from test_ai.api_clients.openai_client import _truncate_middle
+
+        assert _truncate_middle("some text", None) == "some text"
+        assert _truncate_middle("some text", 0) == "some text"
+
+    def test_short_input_unchanged(self):
+        from test_ai.api_clients.openai_client import _truncate_middle
+
+        assert _truncate_middle("short", 100) == "short"
+
+    def test_oversized_input_elides_middle(self):
+        from test_ai.api_clients.openai_client import _truncate_middle
+
+        text = "a" * 10000
+        result = _truncate_middle(text, 100)
+
+        assert len(result) < len(text)
+        assert "tokens elided" in result
+        assert result.startswith("a")
+        assert result.endswith("a")
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_summarize_applies_cap(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        mock_settings.return_value.llm_max_input_tokens = 50
+        client = OpenAIClient()
+
+        with patch.object(client, "_call_api", return_value="summary") as mock_call:
+            client.summarize_text("x" * 10000)
+
+        prompt = mock_call.call_args[0][1][-1]["content"]
+        assert "tokens elided" in prompt
+
+    @patch("test_ai.api_clients.openai_client.OpenAI")
+    def test_summarize_no_cap_by_default(self, mock_openai_cls, mock_settings):
+        from test_ai.api_clients.openai_client import OpenAIClient
+
+        mock_settings.return_value.llm_max_input_tokens = None
+        client = OpenAIClient()
+
+        with patch.object(client, "_call_api", return_value="summary") as mock_call:
+            client.summarize_text("x" * 10000)
+
+        prompt = mock_call.call_args[0][1][-1]["content"]
+        assert "tokens elided" not in prompt
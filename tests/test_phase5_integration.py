@@ -231,6 +231,45 @@ class TestAPIClientResilience:
         assert result == "success"
         assert call_count == 1
 
+    def test_fused_decorator_retries_then_succeeds(self):
+        """Fused resilient_with_retry retries retryable errors in one frame."""
+        from test_ai.api_clients.resilience import resilient_with_retry
+
+        call_count = 0
+
+        @resilient_with_retry(
+            "openai", max_retries=2, base_delay=0.01, rate_limit=False, bulkhead=True
+        )
+        def flaky_call():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise ConnectionError("transient")
+            return "recovered"
+
+        assert flaky_call() == "recovered"
+        assert call_count == 2
+
+    def test_fused_decorator_non_retryable_raises(self):
+        """Non-retryable errors propagate immediately without retries."""
+        from test_ai.api_clients.resilience import resilient_with_retry
+
+        call_count = 0
+
+        @resilient_with_retry(
+            "openai", max_retries=3, base_delay=0.01, rate_limit=False, bulkhead=False
+        )
+        def broken_call():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("permanent")
+
+        import pytest as _pytest
+
+        with _pytest.raises(ValueError):
+            broken_call()
+        assert call_count == 1
+
     def test_resilience_stats_available(self):
         """Test that resilience stats are available."""
         from test_ai.api_clients.resilience import get_all_provider_stats
@@ -536,7 +536,7 @@ class TestProviderManager:
         manager.register("openai", config=openai_config)
         manager.register("anthropic", config=anthropic_config)
         manager.set_fallback_order(["anthropic", "openai"])
-        assert manager._fallback_order == ["anthropic", "openai"]
+        assert list(manager._fallback_order) == ["anthropic", "openai"]
 
     def test_set_fallback_order_unregistered(self, manager, openai_config):
         """Test setting fallback with unregistered provider raises error."""